@@ -4,4 +4,4 @@
 from .scraper_wrapper import scrape_linkedin_profile, set_scraper_preference
 
 # For backward compatibility
-from .scraper import LinkedInScraper
+from .scraper import LinkedInScraper, LinkedInScraperPool, scrape_linkedin_profiles
@@ -0,0 +1,245 @@
+"""
+Shared Chrome setup for the LinkedIn cookie scripts.
+
+refresh_cookies.py and save_cookies.py launch the same anti-detection
+Chrome session, so the options and the tweaks applied after launch are
+defined once here.
+"""
+
+from pathlib import Path
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+try:
+    from ._json_utils import loads as _loads
+except ImportError:
+    from _json_utils import loads as _loads
+
+# Realistic user agent, used for both the launch flag and the CDP override
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Flags for the unattended session check, which only needs the page HTML
+_VALIDATION_ARGUMENTS = (
+    '--headless=new',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--no-first-run',
+    '--mute-audio',
+    '--blink-settings=imagesEnabled=false',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    f'user-agent={USER_AGENT}',
+)
+
+# Resources the session check never needs to download
+_BLOCKED_URLS = ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.svg', '*.css', '*.woff*', '*.mp4']
+
+# Chrome profile kept between runs so caches and the LinkedIn login survive
+PERSIST_DIR = Path.home() / '.cache' / 'alexis-linkedin-profile'
+
+# Command-line flags shared by every session
+_STEALTH_ARGUMENTS = (
+    # Anti-detection measures
+    '--disable-blink-features=AutomationControlled',
+    
+    # Basic browser settings
+    '--start-maximized',
+    '--disable-notifications',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    
+    # Set a realistic user agent
+    f'user-agent={USER_AGENT}',
+)
+
+def build_stealth_options(headless=False, user_data_dir=PERSIST_DIR):
+    """
+    Build Chrome options with anti-detection measures
+    
+    Args:
+        headless (bool): Whether to use Chrome's new headless mode
+        user_data_dir (Path): Persistent profile directory, or None for a
+            fresh throwaway profile
+    
+    Returns:
+        Options: Chrome options for webdriver.Chrome
+    """
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    if user_data_dir is not None:
+        Path(user_data_dir).mkdir(parents=True, exist_ok=True)
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+    
+    for argument in _STEALTH_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    return options
+
+def apply_stealth_cdp(driver):
+    """
+    Apply the anti-detection measures that need a running browser
+    
+    Args:
+        driver: Chrome WebDriver instance
+    """
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+        "userAgent": USER_AGENT,
+        "platform": "macOS"
+    })
+    
+    # Register the navigator patch to run before each page's own scripts,
+    # so LinkedIn's detection code never sees navigator.webdriver
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        "source": """
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            });
+        """
+    })
+
+def is_logged_in(driver, timeout=5):
+    """
+    Check whether the browser profile already has a LinkedIn session
+    
+    Args:
+        driver: Chrome WebDriver instance
+        timeout (int): Seconds to wait for the navigation bar
+    
+    Returns:
+        bool: True if the feed loaded with the logged-in navigation bar
+    """
+    driver.get("https://www.linkedin.com/feed/")
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.ID, "global-nav"))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+# Cookie domains the scraper needs; other sites' cookies are left out
+_LINKEDIN_COOKIE_DOMAINS = ('linkedin.com', 'licdn.com')
+
+def get_linkedin_cookies(driver):
+    """
+    Fetch LinkedIn cookies for every subdomain in one CDP call
+    
+    WebDriver's get_cookies() only returns cookies for the current page's
+    domain, while Network.getAllCookies covers the whole browser. The CDP
+    records are converted to the shape get_cookies() returns, so the saved
+    files still load with driver.add_cookie().
+    
+    Args:
+        driver: Chrome WebDriver instance
+    
+    Returns:
+        list: Cookie dicts with name, value, domain, path, secure, httpOnly
+            and, when present, expiry and sameSite
+    """
+    cookies = []
+    for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']:
+        domain = cookie['domain'].lstrip('.')
+        if not any(domain == d or domain.endswith('.' + d) for d in _LINKEDIN_COOKIE_DOMAINS):
+            continue
+        
+        converted = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie['domain'],
+            'path': cookie['path'],
+            'secure': cookie['secure'],
+            'httpOnly': cookie['httpOnly'],
+        }
+        # Session cookies have no expiry; CDP reports them with expires == -1
+        if not cookie.get('session') and cookie.get('expires', -1) > 0:
+            converted['expiry'] = int(cookie['expires'])
+        if 'sameSite' in cookie:
+            converted['sameSite'] = cookie['sameSite']
+        cookies.append(converted)
+    
+    return cookies
+
+# sameSite values as written by Selenium and cookie-export extensions, mapped to CDP's
+_CDP_SAME_SITE = {'strict': 'Strict', 'lax': 'Lax', 'none': 'None', 'no_restriction': 'None'}
+
+def to_cdp_cookie(cookie):
+    """Convert a saved cookie to the parameters Network.setCookies expects
+    
+    Args:
+        cookie (dict): Cookie from driver.get_cookies() or a browser extension export
+        
+    Returns:
+        dict: CookieParam for the Chrome DevTools Protocol
+    """
+    cdp_cookie = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain') or '.linkedin.com',
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    # Selenium saves "expiry"; extensions such as EditThisCookie save "expirationDate"
+    expires = cookie.get('expiry', cookie.get('expirationDate'))
+    if expires is not None:
+        cdp_cookie['expires'] = expires
+    same_site = _CDP_SAME_SITE.get(str(cookie.get('sameSite', '')).lower())
+    if same_site:
+        cdp_cookie['sameSite'] = same_site
+    return cdp_cookie
+
+def build_validation_options():
+    """
+    Build minimal headless Chrome options for checking a saved session
+    
+    Returns:
+        Options: Chrome options for webdriver.Chrome
+    """
+    options = Options()
+    for argument in _VALIDATION_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    return options
+
+def validate_session(cookies_path, timeout=10):
+    """
+    Check whether LinkedIn still accepts the saved cookies
+    
+    A throwaway headless browser with images, stylesheets and fonts blocked
+    loads the feed with the saved cookies. This is much cheaper than the
+    interactive refresh and needs no user input.
+    
+    Args:
+        cookies_path (str): Path to a cookie list or enhanced session file
+        timeout (int): Seconds to wait for the logged-in navigation bar
+    
+    Returns:
+        bool: True if the feed loaded as a logged-in user
+    """
+    with open(cookies_path, 'rb') as f:
+        cookies = _loads(f.read())
+    if isinstance(cookies, dict):
+        cookies = cookies.get('cookies', [])
+    
+    driver = webdriver.Chrome(options=build_validation_options())
+    try:
+        apply_stealth_cdp(driver)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+        
+        # Set the cookies through CDP so no extra page load is needed to get
+        # onto the LinkedIn domain first
+        cdp_cookies = [to_cdp_cookie(cookie) for cookie in cookies]
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+        
+        return is_logged_in(driver, timeout)
+    finally:
+        driver.quit()
@@ -0,0 +1,204 @@
+"""
+JSON helpers shared by the LinkedIn scripts.
+
+orjson is used when it's installed, falling back to the stdlib json module.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+errors from either parser the same way. The brace scanner finds profile
+objects in agent output and terminal captures.
+"""
+
+import re
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(data):
+    """Serialize data to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def loads(data):
+    """Parse JSON from a str or bytes object"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Characters that matter when matching braces; everything else is skipped.
+# JSON strings can't contain a raw newline, so a newline also ends a string
+# that was opened by a stray quote in the surrounding output.
+_JSON_TOKEN_PATTERN = re.compile(r'[{}"\\\n]')
+_JSON_TOKEN_BYTES_PATTERN = re.compile(rb'[{}"\\\n]')
+
+# Open brace, close brace, quote, backslash and newline for each input type
+_STR_TOKENS = ('{', '}', '"', '\\', '\n')
+_BYTES_TOKENS = (b'{', b'}', b'"', b'\\', b'\n')
+
+class JsonObjectScanner:
+    """
+    Find balanced {...} objects in text that arrives in chunks
+    
+    String literals and escapes inside an object are respected, so braces in
+    values don't throw off the depth count. Every character is looked at
+    once: each unclosed brace is kept on a stack along with the objects that
+    closed inside it, so when a brace turns out to be stray text those
+    objects are reported without scanning the text again. Chunks are only
+    joined when an object is sliced out of them.
+    
+    Chunks can be str or bytes-like, such as an mmap, but not a mix of both.
+    Bytes-like input is scanned in place and only the reported objects are
+    copied.
+    """
+    
+    def __init__(self, max_object_size=None):
+        """
+        Initialize the scanner
+        
+        Args:
+            max_object_size (int): Once an unclosed brace is this far behind the
+                end of the input it's treated as stray text, which bounds the
+                memory held for open objects (optional)
+        """
+        self.max_object_size = max_object_size
+        self._chunks = []  # Text from the outermost open brace on, oldest first
+        self._base = 0  # Offset of the first chunk in the whole input
+        self._end = 0  # Offset just past the text fed so far
+        self._open = []  # [offset, spans of objects closed inside it] per unclosed brace
+        self._in_string = False
+        self._skip_next = False  # The last chunk ended on an escaping backslash
+    
+    def feed(self, text):
+        """
+        Add text to the scanner
+        
+        Args:
+            text (str or bytes-like): Next chunk of text
+            
+        Yields:
+            str or bytes: Each object completed by this chunk
+        """
+        if not len(text):
+            return
+        if isinstance(text, str):
+            pattern = _JSON_TOKEN_PATTERN
+            open_brace, close_brace, quote, backslash, newline = _STR_TOKENS
+        else:
+            pattern = _JSON_TOKEN_BYTES_PATTERN
+            open_brace, close_brace, quote, backslash, newline = _BYTES_TOKENS
+        offset = self._end
+        self._chunks.append(text)
+        self._end += len(text)
+        open_braces = self._open
+        skip_until = offset + 1 if self._skip_next else offset
+        
+        for token in pattern.finditer(text):
+            i = offset + token.start()
+            if i < skip_until:
+                continue  # Escaped character
+            char = token.group()
+            
+            if not open_braces:
+                if char == open_brace:
+                    open_braces.append([i, []])
+            elif self._in_string:
+                if char == backslash:
+                    skip_until = i + 2
+                elif char == quote or char == newline:
+                    self._in_string = False
+            elif char == quote:
+                self._in_string = True
+            elif char == open_brace:
+                open_braces.append([i, []])
+            elif char == close_brace:
+                start = open_braces.pop()[0]
+                if open_braces:
+                    # Only reported if the enclosing brace never closes
+                    open_braces[-1][1].append((start, i + 1))
+                else:
+                    yield self._slice(start, i + 1)
+        
+        self._skip_next = skip_until > self._end
+        
+        # Give up on open objects that have grown too large to be real ones
+        if self.max_object_size is not None:
+            while open_braces and self._end - open_braces[0][0] > self.max_object_size:
+                spans = open_braces.pop(0)[1]
+                if spans:
+                    self._join_chunks()
+                for start, end in spans:
+                    yield self._slice(start, end)
+            if not open_braces:
+                self._in_string = False
+        
+        self._discard_before(open_braces[0][0] if open_braces else self._end)
+    
+    def finish(self):
+        """
+        Signal the end of the input
+        
+        Braces that never closed are treated as stray text, so the objects
+        that closed inside them are reported instead.
+        
+        Yields:
+            str or bytes: Objects found inside unclosed braces
+        """
+        self._join_chunks()
+        for _, spans in self._open:
+            for start, end in spans:
+                yield self._slice(start, end)
+        self.__init__(self.max_object_size)
+    
+    def _join_chunks(self):
+        """Join the pending chunks into one before slicing many objects from them"""
+        if len(self._chunks) > 1:
+            self._chunks = [self._chunks[0][:0].join(self._chunks)]
+    
+    def _slice(self, start, end):
+        """Return the input between two offsets, joining the chunks it spans"""
+        chunks = self._chunks
+        index = 0
+        offset = self._base
+        while start >= offset + len(chunks[index]):
+            offset += len(chunks[index])
+            index += 1
+        
+        last = index
+        last_end = offset + len(chunks[index])
+        while end > last_end:
+            last += 1
+            last_end += len(chunks[last])
+        if last > index:
+            chunks[index:last + 1] = [chunks[index][:0].join(chunks[index:last + 1])]
+        return chunks[index][start - offset:end - offset]
+    
+    def _discard_before(self, pos):
+        """Drop the text before an offset, which no open object needs"""
+        chunks = self._chunks
+        base = self._base
+        drop = 0
+        while drop < len(chunks) and base + len(chunks[drop]) <= pos:
+            base += len(chunks[drop])
+            drop += 1
+        del chunks[:drop]
+        if chunks and base < pos:
+            chunks[0] = chunks[0][pos - base:]
+            base = pos
+        self._base = base
+
+def iter_json_objects(text, start=0):
+    """
+    Yield balanced {...} substrings of text in a single pass
+    
+    Args:
+        text (str or bytes-like): Text that may contain JSON objects
+        start (int): Index to start scanning from
+        
+    Yields:
+        str or bytes: Candidate JSON object strings
+    """
+    scanner = JsonObjectScanner()
+    yield from scanner.feed(text[start:] if start else text)
+    yield from scanner.finish()
@@ -7,58 +7,65 @@ and convert it into a persona for the AI clone.
 """
 
 import os
-import json
 import time
+import asyncio
+import importlib.util
 from pathlib import Path
 from scraper_wrapper import scrape_linkedin_profile
 
+try:
+    from ._json_utils import dumps as _dumps, loads as _loads
+except ImportError:
+    from _json_utils import dumps as _dumps, loads as _loads
 
-def create_persona_from_linkedin(profile_url, cookies_path=None, headless=True, timeout=120):
-    """Create a persona document from a LinkedIn profile
+# Check for Browser-Use once without importing it
+BROWSER_USE_AVAILABLE = importlib.util.find_spec("browser_use") is not None
+
+# Saved personas younger than this are reused instead of scraping again
+PERSONA_CACHE_TTL = 24 * 3600
+
+
+def check_cookies(cookies_path):
+    """Check that the cookie file used by the original scraper exists and report its age
     
     Args:
-        profile_url (str): URL of the LinkedIn profile to scrape
-        cookies_path (str): Path to the cookies.json file for authentication (only used by original scraper)
-        headless (bool): Whether to run the browser in headless mode
-        timeout (int): Maximum time in seconds to spend scraping a profile
+        cookies_path (str): Path to the cookies.json file
         
     Returns:
-        dict: Persona data extracted from LinkedIn profile
+        bool: False if the cookie file is missing, True otherwise
     """
-    # Scrape the profile
-    print(f"Scraping LinkedIn profile: {profile_url}")
-    
-    # Check if we're using the original scraper that needs cookies
-    using_original = False
+    # Verify cookies path exists (a single stat also gives us the age)
     try:
-        import browser_use
-        print("Using Browser-Use for LinkedIn scraping (no cookies required)")
-    except ImportError:
-        using_original = True
-    
-    if using_original and cookies_path:
-        # Verify cookies path exists
-        if not os.path.exists(cookies_path):
-            print(f"Error: Cookie file not found at {cookies_path}")
-            print("Please make sure your cookies.json file exists and is up to date")
-            print(f"Run the refresh_cookies.py script to generate a new cookies.json file:")
-            print(f"  python refresh_cookies.py --interactive --output {cookies_path}")
-            return None
-            
-        # Check cookie age
-        cookie_age = time.time() - os.path.getmtime(cookies_path)
-        cookie_age_hours = cookie_age / 3600
-        if cookie_age_hours > 1:
-            print(f"Warning: Cookie file is {cookie_age_hours:.1f} hours old")
-            print("LinkedIn cookies typically expire after 1-2 hours when used outside the browser")
-            print("\nTry refreshing your cookies with the refresh_cookies.py script:")
-            print(f"  python refresh_cookies.py --interactive --output {cookies_path}")
-        else:
-            print(f"Cookie file is {cookie_age_hours:.1f} hours old (should be valid)")
-    
-    # Scrape profile with specified timeout
-    profile_data = scrape_linkedin_profile(profile_url, cookies_path, headless=headless, timeout=timeout)
+        cookie_stat = os.stat(cookies_path)
+    except OSError:
+        print(f"Error: Cookie file not found at {cookies_path}")
+        print("Please make sure your cookies.json file exists and is up to date")
+        print(f"Run the refresh_cookies.py script to generate a new cookies.json file:")
+        print(f"  python refresh_cookies.py --interactive --output {cookies_path}")
+        return False
+        
+    # Check cookie age
+    cookie_age = time.time() - cookie_stat.st_mtime
+    cookie_age_hours = cookie_age / 3600
+    if cookie_age_hours > 1:
+        print(f"Warning: Cookie file is {cookie_age_hours:.1f} hours old")
+        print("LinkedIn cookies typically expire after 1-2 hours when used outside the browser")
+        print("\nTry refreshing your cookies with the refresh_cookies.py script:")
+        print(f"  python refresh_cookies.py --interactive --output {cookies_path}")
+    else:
+        print(f"Cookie file is {cookie_age_hours:.1f} hours old (should be valid)")
+    return True
+
+
+def profile_to_persona(profile_data):
+    """Convert scraped LinkedIn profile data into a persona document
     
+    Args:
+        profile_data (dict): Profile data returned by the scraper
+        
+    Returns:
+        dict: Persona data, or None if the scrape failed without partial data
+    """
     if profile_data is None or ("error" in profile_data and "partial_data" not in profile_data):
         if profile_data and "error" in profile_data:
             print(f"Error: {profile_data['error']}")
@@ -69,71 +76,214 @@ def create_persona_from_linkedin(profile_url, cookies_path=None, headless=True,
         print("Using partial profile data due to timeout or error")
         profile_data = profile_data["partial_data"]
     
-    # Convert to persona format
+    basic_info = profile_data.get("basic_info") or {}
+    experience = profile_data.get("experience") or []
+    
+    # Convert to persona format (the first experience is usually the current role)
     persona = {
-        "name": profile_data["basic_info"].get("name", "Unknown"),
-        "headline": profile_data["basic_info"].get("headline", ""),
-        "location": profile_data["basic_info"].get("location", ""),
+        "name": basic_info.get("name", "Unknown"),
+        "headline": basic_info.get("headline", ""),
+        "location": basic_info.get("location", ""),
         "bio": profile_data.get("about", ""),
-        "current_role": None,
-        "past_roles": [],
-        "education": [],
+        "current_role": {
+            "title": experience[0].get("title", ""),
+            "company": experience[0].get("company", ""),
+            "duration": experience[0].get("duration", "")
+        } if experience else None,
+        "past_roles": [
+            {
+                "title": exp.get("title", ""),
+                "company": exp.get("company", ""),
+                "duration": exp.get("duration", "")
+            }
+            for exp in experience[1:]
+        ],
+        "education": [
+            {"school": edu.get("school", ""), "degree": edu.get("degree", "")}
+            for edu in profile_data.get("education") or []
+        ],
         "skills": profile_data.get("skills", []),
         "interests": profile_data.get("interests", [])
     }
     
-    # Process experience
-    if profile_data["experience"]:
-        # First experience is usually current
-        current = profile_data["experience"][0]
-        persona["current_role"] = {
-            "title": current.get("title", ""),
-            "company": current.get("company", ""),
-            "duration": current.get("duration", "")
-        }
+    return persona
+
+
+def create_persona_from_linkedin(profile_url, cookies_path=None, headless=True, timeout=120, scraper=None):
+    """Create a persona document from a LinkedIn profile
+    
+    Args:
+        profile_url (str): URL of the LinkedIn profile to scrape
+        cookies_path (str): Path to the cookies.json file for authentication (only used by original scraper)
+        headless (bool): Whether to run the browser in headless mode
+        timeout (int): Maximum time in seconds to spend scraping a profile
+        scraper (LinkedInScraper): Open original scraper whose browser session should be reused (optional)
         
-        # Rest are past roles
-        for exp in profile_data["experience"][1:]:
-            persona["past_roles"].append({
-                "title": exp.get("title", ""),
-                "company": exp.get("company", ""),
-                "duration": exp.get("duration", "")
-            })
+    Returns:
+        dict: Persona data extracted from LinkedIn profile
+    """
+    # Scrape the profile
+    print(f"Scraping LinkedIn profile: {profile_url}")
     
-    # Process education
-    for edu in profile_data["education"]:
-        persona["education"].append({
-            "school": edu.get("school", ""),
-            "degree": edu.get("degree", "")
-        })
+    # Reuse the caller's browser session instead of starting a new one
+    if scraper is not None:
+        return profile_to_persona(scraper.scrape_profile(profile_url, timeout=timeout))
     
-    return persona
+    # Check if we're using the original scraper that needs cookies
+    using_original = not BROWSER_USE_AVAILABLE
+    if not using_original:
+        print("Using Browser-Use for LinkedIn scraping (no cookies required)")
+    
+    if using_original and cookies_path and not check_cookies(cookies_path):
+        return None
+    
+    # Scrape profile with specified timeout
+    profile_data = scrape_linkedin_profile(profile_url, cookies_path, headless=headless, timeout=timeout)
+    
+    return profile_to_persona(profile_data)
+
+
+def create_personas_in_session(profile_urls, cookies_path, headless=True, timeout=120):
+    """Create persona documents for several profiles with one original-scraper browser
+    
+    The browser is started and authenticated once, then every profile is
+    scraped in the same session, so startup is paid once instead of per URL.
+    
+    Args:
+        profile_urls (list): URLs of the LinkedIn profiles to scrape
+        cookies_path (str): Path to the cookies.json file for authentication
+        headless (bool): Whether to run the browser in headless mode
+        timeout (int): Maximum time in seconds to spend scraping each profile
+        
+    Returns:
+        list: Persona data for each URL, in order (None where scraping failed)
+    """
+    # Imported here so Selenium is only required when the original scraper is used
+    from scraper import LinkedInScraper
+    
+    if not check_cookies(cookies_path):
+        return [None] * len(profile_urls)
+    
+    with LinkedInScraper(cookies_path=cookies_path, headless=headless) as scraper:
+        return [
+            create_persona_from_linkedin(url, cookies_path, headless=headless, timeout=timeout, scraper=scraper)
+            for url in profile_urls
+        ]
+
+
+async def create_personas_from_linkedin(profile_urls, cookies_path=None, headless=True, timeout=120, concurrency=8):
+    """Create persona documents for several LinkedIn profiles concurrently
+    
+    Scraping is I/O bound, so each profile is scraped in a worker thread while
+    a semaphore caps how many scrapes run at once.
+    
+    Args:
+        profile_urls (list): URLs of the LinkedIn profiles to scrape
+        cookies_path (str): Path to the cookies.json file for authentication (only used by original scraper)
+        headless (bool): Whether to run the browser in headless mode
+        timeout (int): Maximum time in seconds to spend scraping each profile
+        concurrency (int): Maximum number of profiles to scrape at the same time
+        
+    Returns:
+        list: Persona data for each URL, in order (None where scraping failed)
+    """
+    using_original = not BROWSER_USE_AVAILABLE
+    if not using_original:
+        print("Using Browser-Use for LinkedIn scraping (no cookies required)")
+    
+    if using_original and cookies_path and not check_cookies(cookies_path):
+        return [None] * len(profile_urls)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def scrape_one(profile_url):
+        async with semaphore:
+            print(f"Scraping LinkedIn profile: {profile_url}")
+            return await asyncio.to_thread(
+                scrape_linkedin_profile, profile_url, cookies_path, headless=headless, timeout=timeout
+            )
+    
+    results = await asyncio.gather(*(scrape_one(url) for url in profile_urls))
+    return [profile_to_persona(profile_data) for profile_data in results]
+
+
+def get_profile_name(profile_url):
+    """Extract the profile username from a LinkedIn URL for naming files
+    
+    Args:
+        profile_url (str): LinkedIn profile URL
+        
+    Returns:
+        str: Profile username, or "unknown" if the URL has none
+    """
+    _, found, rest = profile_url.partition("linkedin.com/in/")
+    if not found:
+        return "unknown"
+    profile_name = rest.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+    return profile_name or "unknown"
+
+
+def load_cached_persona(persona_path, max_age=PERSONA_CACHE_TTL):
+    """Load a previously saved persona if it is recent enough to reuse
+    
+    Args:
+        persona_path (str): Path the persona was saved to
+        max_age (int): Maximum age of the file in seconds
+        
+    Returns:
+        dict: Cached persona data, or None if missing, stale or unreadable
+    """
+    try:
+        if time.time() - os.stat(persona_path).st_mtime >= max_age:
+            return None
+        with open(persona_path, 'rb') as f:
+            cached = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict):
+        return None
+    
+    # Some tools save raw profile data under the persona file name
+    if "basic_info" in cached:
+        return profile_to_persona(cached)
+    return cached if "name" in cached else None
 
 
 def save_persona(persona, output_path):
-    """Save the persona to a JSON file"""
-    with open(output_path, 'w') as f:
-        json.dump(persona, f, indent=2)
+    """Save the persona to a JSON file
+    
+    The file is written to a temporary path first and then moved into place,
+    so a crash mid-write never leaves a truncated persona behind.
+    """
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(_dumps(persona))
+    os.replace(temp_path, output_path)
     print(f"Persona saved to {output_path}")
 
 
 if __name__ == "__main__":
     import argparse
-    import re
     
     parser = argparse.ArgumentParser(description="Create a persona from a LinkedIn profile")
-    parser.add_argument("profile_url", help="LinkedIn profile URL to scrape")
+    parser.add_argument("profile_urls", nargs="+", metavar="profile_url", help="LinkedIn profile URL(s) to scrape")
     
     # Default to the cookies.json in the root directory
     default_cookies = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cookies.json")
     parser.add_argument("--cookies", default=default_cookies, help="Path to cookies.json file (for original scraper)")
     parser.add_argument("--no-headless", action="store_true", help="Run in visible browser mode (not headless)")
     parser.add_argument("--debug", action="store_true", help="Show debug information")
-    parser.add_argument("--output", help="Output file path for persona (default: auto-generated)")
-    parser.add_argument("--force-original", action="store_true", help="Force the use of the original scraper")
+    parser.add_argument("--output", help="Output file path for persona (default: auto-generated, single URL only)")
+    parser.add_argument("--force-original", action="store_true", help="Force the use of the original scraper (one browser session for all URLs)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum number of profiles to scrape at once")
+    parser.add_argument("--no-cache", action="store_true", help="Scrape again even if a recent persona file already exists")
     
     args = parser.parse_args()
     
+    if args.output and len(args.profile_urls) > 1:
+        parser.error("--output can only be used with a single profile URL")
+    
     # Determine headless mode based on arguments
     headless = not args.no_headless
     
@@ -145,28 +295,46 @@ if __name__ == "__main__":
         print(f"Using cookies from: {args.cookies}")
         print(f"Headless mode: {headless}")
         print(f"Timeout: {timeout} seconds")
+    
+    # Create profiles directory if it doesn't exist
+    profiles_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "data/linkedin_profiles")
+    os.makedirs(profiles_dir, exist_ok=True)
+    
+    # Set output paths (use provided path or generate one per profile)
+    output_paths = [
+        args.output if args.output else os.path.join(profiles_dir, f"{get_profile_name(url)}_persona.json")
+        for url in args.profile_urls
+    ]
+    
+    # Reuse recently saved personas instead of scraping them again
+    personas = [None if args.no_cache else load_cached_persona(path) for path in output_paths]
+    cached = [persona is not None for persona in personas]
+    urls_to_scrape = [url for url, is_cached in zip(args.profile_urls, cached) if not is_cached]
+    
+    # Create personas
+    if not urls_to_scrape:
+        scraped = []
+    elif args.force_original:
+        scraped = create_personas_in_session(urls_to_scrape, args.cookies, headless=headless, timeout=timeout)
+    elif len(urls_to_scrape) == 1:
+        scraped = [create_persona_from_linkedin(urls_to_scrape[0], args.cookies, headless=headless, timeout=timeout)]
+    else:
+        scraped = asyncio.run(create_personas_from_linkedin(
+            urls_to_scrape, args.cookies, headless=headless, timeout=timeout, concurrency=args.concurrency
+        ))
+    scraped = iter(scraped)
+    
+    for profile_url, output_path, persona, is_cached in zip(args.profile_urls, output_paths, personas, cached):
+        if is_cached:
+            print(f"\nUsing cached persona from {output_path} (use --no-cache to scrape again)")
+            continue
         
-    # Create persona
-    persona = create_persona_from_linkedin(args.profile_url, args.cookies, headless=headless, timeout=timeout)
-    
-    if persona:
-        # Extract profile username from URL for naming the file
-        profile_name = "unknown"
-        url_match = re.search(r'linkedin\.com/in/([\w-]+)', args.profile_url)
-        if url_match:
-            profile_name = url_match.group(1)
-        
-        # Create profiles directory if it doesn't exist
-        profiles_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "data/linkedin_profiles")
-        if not os.path.exists(profiles_dir):
-            os.makedirs(profiles_dir)
-        
-        # Set output path (use provided path or generate one)
-        output_path = args.output if args.output else os.path.join(profiles_dir, f"{profile_name}_persona.json")
+        persona = next(scraped)
+        if not persona:
+            print(f"\nFailed to create persona for {profile_url}.")
+            continue
         
         # Save the persona
         save_persona(persona, output_path)
         print(f"\nPersona created successfully and saved to {output_path}!")
         print("You can now use this persona to enhance your AI clone.")
-    else:
-        print("\nFailed to create persona.")
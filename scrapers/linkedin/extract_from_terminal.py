@@ -9,13 +9,62 @@ and save it to a file, avoiding the complexity of the main scraper.
 import json
 import sys
 import os
-import re
 import argparse
 from pathlib import Path
 
+try:
+    from ._json_utils import dumps as _dumps, loads as _loads, JsonObjectScanner, iter_json_objects
+except ImportError:
+    from _json_utils import dumps as _dumps, loads as _loads, JsonObjectScanner, iter_json_objects
+
+def _iter_code_blocks(text):
+    """
+    Yield the contents of fenced ```json code blocks in text
+    
+    Args:
+        text (str): Text that may contain fenced code blocks
+        
+    Yields:
+        str: Stripped contents of each code block
+    """
+    start = text.find('```json')
+    while start != -1:
+        end = text.find('```', start + 7)
+        if end == -1:
+            return
+        yield text[start + 7:end].strip()
+        start = text.find('```json', end + 3)
+
+def _parse_profile(candidate):
+    """
+    Parse a candidate JSON string as LinkedIn profile data
+    
+    Args:
+        candidate (str): Candidate JSON string
+        
+    Returns:
+        dict: Profile data or None if the candidate isn't a profile
+    """
+    # Skip the parser for candidates that can't contain the expected keys
+    if '"basic_info"' not in candidate or '"experience"' not in candidate:
+        return None
+    
+    try:
+        data = _loads(candidate)
+    except json.JSONDecodeError:
+        return None
+    
+    # Verify it's a LinkedIn profile by checking for expected keys
+    if isinstance(data, dict) and "basic_info" in data and "experience" in data:
+        return data
+    return None
+
 def extract_json_from_text(text):
     """
-    Extract JSON data from text using regex patterns
+    Extract JSON data from text
+    
+    Fenced ```json code blocks are tried first, then every balanced JSON
+    object in the text.
     
     Args:
         text (str): Text containing JSON data
@@ -23,34 +72,58 @@ def extract_json_from_text(text):
     Returns:
         dict: Extracted JSON data or None if not found
     """
-    # Try to find JSON data in the text using various patterns
-    json_patterns = [
-        r'```json\s*(.*?)\s*```',  # JSON in code block
-        r'\{[\s\S]*"basic_info"[\s\S]*\}',  # Any JSON containing basic_info
-        r'\{[\s\S]*"name"[\s\S]*\}'  # Any JSON containing name
-    ]
-    
-    for pattern in json_patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-        for match in matches:
-            try:
-                json_str = match if '{' in match else match
-                data = json.loads(json_str)
-                # Verify it's a LinkedIn profile by checking for expected keys
-                if "basic_info" in data and "experience" in data:
-                    return data
-            except json.JSONDecodeError:
-                continue
+    for candidate in _iter_code_blocks(text):
+        data = _parse_profile(candidate)
+        if data:
+            return data
+    
+    for candidate in iter_json_objects(text):
+        data = _parse_profile(candidate)
+        if data:
+            return data
     
     return None
 
-def save_profile_data(profile_data, output_path):
+def extract_json_from_stream(stream, chunk_size=65536):
+    """
+    Extract JSON data from a text stream, reading it in chunks
+    
+    Reading stops as soon as a profile is found, so the whole input never
+    has to be held in memory.
+    
+    Args:
+        stream: Readable text stream such as sys.stdin or an open file
+        chunk_size (int): Number of characters to read at a time
+        
+    Returns:
+        dict: Extracted JSON data or None if not found
+    """
+    scanner = JsonObjectScanner()
+    
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        for candidate in scanner.feed(chunk):
+            data = _parse_profile(candidate)
+            if data:
+                return data
+    
+    for candidate in scanner.finish():
+        data = _parse_profile(candidate)
+        if data:
+            return data
+    
+    return None
+
+def save_profile_data(profile_data, output_path, serialized=None):
     """
     Save profile data to a file
     
     Args:
         profile_data (dict): Profile data to save
         output_path (str): Path to save the data to
+        serialized (bytes): Already serialized profile data (optional)
         
     Returns:
         bool: True if successful, False otherwise
@@ -59,9 +132,15 @@ def save_profile_data(profile_data, output_path):
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Write the data to the file
-        with open(output_path, 'w') as f:
-            json.dump(profile_data, indent=2, fp=f)
+        if serialized is None:
+            serialized = _dumps(profile_data)
+        
+        # Write to a temporary file and move it into place so a crash
+        # mid-write can't leave a truncated profile behind
+        temp_path = output_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(serialized)
+        os.replace(temp_path, output_path)
         
         print(f"Profile data saved to {output_path}")
         return True
@@ -76,23 +155,22 @@ def main():
     
     args = parser.parse_args()
     
-    # Read input from file or stdin
+    # Extract JSON data from file or stdin
     if args.input:
         with open(args.input, 'r') as f:
-            text = f.read()
+            profile_data = extract_json_from_stream(f)
     else:
         print("Paste the terminal output containing JSON data (Ctrl+D to finish):")
-        text = sys.stdin.read()
-    
-    # Extract JSON data from the text
-    profile_data = extract_json_from_text(text)
+        profile_data = extract_json_from_stream(sys.stdin)
     
     if profile_data:
+        # Serialize once and reuse the result for both the terminal and the file
+        serialized = _dumps(profile_data)
         print("Successfully extracted profile data:")
-        print(json.dumps(profile_data, indent=2))
+        print(serialized.decode('utf-8'))
         
         # Save the profile data
-        save_profile_data(profile_data, args.output)
+        save_profile_data(profile_data, args.output, serialized=serialized)
     else:
         print("No valid LinkedIn profile data found in the input")
         sys.exit(1)
@@ -8,21 +8,29 @@ It can also launch a browser to help you refresh cookies.
 """
 
 import os
-import json
 import time
 import sys
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from ._json_utils import dumps as _dumps, loads as _loads
+except ImportError:
+    from _json_utils import dumps as _dumps, loads as _loads
+
 # Import selenium components if available
 try:
     from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    try:
+        from ._browser import build_stealth_options, apply_stealth_cdp, is_logged_in, get_linkedin_cookies, validate_session
+    except ImportError:
+        from _browser import build_stealth_options, apply_stealth_cdp, is_logged_in, get_linkedin_cookies, validate_session
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -47,15 +55,16 @@ def check_cookie_status(cookie_path="cookies.json"):
         "message": ""
     }
     
-    # Check if file exists
-    if not os.path.exists(cookie_path):
+    # Check if file exists and get its age with a single stat call
+    try:
+        mod_time = os.stat(cookie_path).st_mtime
+    except FileNotFoundError:
         status["message"] = f"Cookie file not found at {cookie_path}"
         return status
     
     status["exists"] = True
     
     # Check cookie age
-    mod_time = os.path.getmtime(cookie_path)
     age_seconds = time.time() - mod_time
     status["age_hours"] = age_seconds / 3600
     
@@ -66,22 +75,25 @@ def check_cookie_status(cookie_path="cookies.json"):
     # Calculate expiration time (estimate 2 hours from creation)
     expiration = last_modified + timedelta(hours=2)
     status["estimated_expiration"] = expiration.strftime("%Y-%m-%d %H:%M:%S")
+    status["estimated_expiration_dt"] = expiration
     
     # Check if expired
     status["expired"] = datetime.now() > expiration
     
     # Read cookie file
     try:
-        with open(cookie_path, 'r') as f:
-            cookies = json.load(f)
+        # Read bytes so the parser does the only decode pass
+        with open(cookie_path, 'rb') as f:
+            cookies = _loads(f.read())
+        
+        # Unwrap the enhanced session format saved by --interactive
+        if isinstance(cookies, dict) and "cookies" in cookies:
+            cookies = cookies["cookies"]
             
         status["cookie_count"] = len(cookies)
         
-        # Check for critical LinkedIn cookies
-        for cookie in cookies:
-            if cookie.get("name") == "li_at":
-                status["li_at_present"] = True
-                break
+        # Check for the critical LinkedIn cookie, stopping at the first match
+        status["li_at_present"] = any(cookie.get("name") == "li_at" for cookie in cookies if isinstance(cookie, dict))
                 
         # Determine if likely valid
         status["valid"] = status["li_at_present"] and not status["expired"]
@@ -100,22 +112,30 @@ def check_cookie_status(cookie_path="cookies.json"):
 
 def print_cookie_instructions(cookie_path="cookies.json"):
     """Print instructions for refreshing LinkedIn cookies"""
-    print("\nTo refresh your LinkedIn cookies, follow these steps:")
-    print("1. Open Chrome and log in to LinkedIn (https://www.linkedin.com)")
-    print("2. Install a cookie export extension like 'EditThisCookie' from the Chrome Web Store")
-    print("3. Navigate to LinkedIn while logged in")
-    print("4. Click the EditThisCookie extension icon")
-    print("5. Click 'Export' to copy all cookies to clipboard")
-    print(f"6. Open {cookie_path} in a text editor and replace all content with the copied cookies")
-    print("7. Save the file and run your scraper again")
-    print("\nNote: LinkedIn cookies typically expire after 1-2 hours when used outside the browser")
-    print("For more reliable scraping, refresh cookies immediately before running the scraper")
+    # Build the whole message first so it goes out in a single write
+    instructions = f"""
+To refresh your LinkedIn cookies, follow these steps:
+1. Open Chrome and log in to LinkedIn (https://www.linkedin.com)
+2. Install a cookie export extension like 'EditThisCookie' from the Chrome Web Store
+3. Navigate to LinkedIn while logged in
+4. Click the EditThisCookie extension icon
+5. Click 'Export' to copy all cookies to clipboard
+6. Open {cookie_path} in a text editor and replace all content with the copied cookies
+7. Save the file and run your scraper again
+
+Note: LinkedIn cookies typically expire after 1-2 hours when used outside the browser
+For more reliable scraping, refresh cookies immediately before running the scraper
+"""
     
     if SELENIUM_AVAILABLE:
-        print("\nAlternatively, use the --interactive flag to launch a browser session:")
-        print(f"  python refresh_cookies.py --interactive --output {cookie_path}")
-        print("This will open a browser window where you can log in to LinkedIn")
-        print("After logging in, the script will automatically save your cookies")
+        instructions += f"""
+Alternatively, use the --interactive flag to launch a browser session:
+  python refresh_cookies.py --interactive --output {cookie_path}
+This will open a browser window where you can log in to LinkedIn
+After logging in, the script will automatically save your cookies
+"""
+    
+    sys.stdout.write(instructions)
 
 def extract_cookies_from_browser(output_path="cookies.json", headless=False, save_session_data=True):
     """Launch a browser session to get fresh LinkedIn cookies with enhanced anti-detection
@@ -144,47 +164,19 @@ def extract_cookies_from_browser(output_path="cookies.json", headless=False, sav
     print("Launching browser session to refresh LinkedIn cookies...")
     print("You will need to manually log in to LinkedIn in the browser window")
     
-    # Configure browser with anti-detection measures
-    options = Options()
-    if headless:
-        options.add_argument('--headless=new')  # Use newer headless mode if requested
-        
-    # Anti-detection measures
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_experimental_option('excludeSwitches', ['enable-automation'])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    # Basic browser settings
-    options.add_argument('--start-maximized')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    # Set a realistic user agent
-    options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
-    
-    # Launch browser
-    driver = webdriver.Chrome(options=options)
-    
-    # Apply additional anti-detection measures
-    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-        "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "platform": "macOS"
-    })
-    
-    # Execute JS to modify navigator properties to avoid detection
-    driver.execute_script("""
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        });
-    """)
+    # Launch browser with anti-detection measures
+    driver = webdriver.Chrome(options=build_stealth_options(headless))
+    apply_stealth_cdp(driver)
     
     try:
-        # Navigate to LinkedIn
-        print("Opening LinkedIn login page...")
-        driver.get("https://www.linkedin.com/login")
-        
-        if not headless:
+        # The persistent profile is often still logged in from the last run
+        if is_logged_in(driver):
+            print("Existing LinkedIn session found, skipping login")
+        elif not headless:
+            # Navigate to LinkedIn
+            print("Opening LinkedIn login page...")
+            driver.get("https://www.linkedin.com/login")
+            
             # Wait for user to log in (detect when they're on the feed page)
             print("\nPlease log in to LinkedIn in the browser window")
             print("The script will automatically continue once you're logged in")
@@ -205,62 +197,58 @@ def extract_cookies_from_browser(output_path="cookies.json", headless=False, sav
             driver.quit()
             return False
             
-        # Check if we're logged in by looking for key elements
-        if "Sign in" in driver.page_source or "Join now" in driver.page_source:
+        # Check if we're logged in by looking for the global navigation bar
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "global-nav"))
+            )
+        except TimeoutException:
             print("Error: Not logged in to LinkedIn")
             driver.quit()
             return False
             
         print("Successfully logged in to LinkedIn!")
         
-        # Extract cookies
-        cookies = driver.get_cookies()
+        # Extract cookies for every LinkedIn subdomain in one CDP round trip
+        cookies = get_linkedin_cookies(driver)
+        
+        # Take the creation time once, after login, and reuse it below
+        now = datetime.now()
+        created_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        expires_at = (now + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S')
         
         # Create a more comprehensive session data structure
         session_data = {
             'cookies': cookies,
-            'timestamp': time.time(),
-            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': now.timestamp(),
+            'created_at': created_at,
             'user_agent': driver.execute_script('return navigator.userAgent;'),
             'version': '1.1'  # Version of the session format
         }
         
         if save_session_data:
-            # Extract localStorage for additional authentication context
+            # Extract localStorage and sessionStorage for additional authentication
+            # context in a single round trip to the browser
             try:
-                local_storage = driver.execute_script("""
-                    var items = {};
-                    for (var i = 0, len = localStorage.length; i < len; ++i) {
-                        var key = localStorage.key(i);
-                        var value = localStorage.getItem(key);
-                        items[key] = value;
-                    }
-                    return items;
-                """)
-                session_data['local_storage'] = local_storage
-                
-                # Extract sessionStorage
-                session_storage = driver.execute_script("""
-                    var items = {};
-                    for (var i = 0, len = sessionStorage.length; i < len; ++i) {
-                        var key = sessionStorage.key(i);
-                        var value = sessionStorage.getItem(key);
-                        items[key] = value;
-                    }
-                    return items;
+                storage = driver.execute_script("""
+                    return {
+                        local: Object.fromEntries(Object.entries(localStorage)),
+                        session: Object.fromEntries(Object.entries(sessionStorage))
+                    };
                 """)
-                session_data['session_storage'] = session_storage
+                session_data['local_storage'] = storage['local']
+                session_data['session_storage'] = storage['session']
                 print("✅ Enhanced session data captured (may extend cookie lifetime)")
             except Exception as e:
                 print(f"Warning: Could not extract browser storage data: {e}")
         
         # Save session data to file
-        with open(output_path, 'w') as f:
-            json.dump(session_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(session_data))
             
         print(f"Saved enhanced session with {len(cookies)} cookies to {output_path}")
-        print(f"Session creation time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Estimated expiration: {(datetime.now() + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Session creation time: {created_at}")
+        print(f"Estimated expiration: {expires_at}")
         
         # Verify we have the critical li_at cookie
         li_at_present = any(cookie.get("name") == "li_at" for cookie in cookies)
@@ -285,6 +273,7 @@ def main():
     parser.add_argument("--output", help="Output path for cookies (defaults to --cookies value)")
     parser.add_argument("--interactive", action="store_true", help="Launch browser for interactive cookie refresh")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode (not recommended)")
+    parser.add_argument("--validate", action="store_true", help="Check the cookies against LinkedIn in a headless browser")
     
     args = parser.parse_args()
     
@@ -333,21 +322,43 @@ def main():
         print(f"  python refresh_cookies.py --interactive --output {args.cookies}")
         return
     
-    print(f"\nLast modified: {status['last_modified']}")
-    print(f"Age: {status['age_hours']:.1f} hours")
-    print(f"Cookie count: {status['cookie_count']}")
-    print(f"Critical auth cookie present: {'✅' if status['li_at_present'] else '❌'}")
-    print(f"Estimated expiration: {status['estimated_expiration']}")
-    print(f"Status: {'✅ Valid' if status['valid'] else '❌ Invalid/Expired'}")
-    print(f"Message: {status['message']}")
+    # Optionally confirm with LinkedIn itself that the cookies still work;
+    # there's no point checking cookies that have already aged out
+    if args.validate and status["valid"]:
+        if not SELENIUM_AVAILABLE:
+            print("Warning: Selenium is not installed. Skipping the live session check.")
+        else:
+            print("Checking the session against LinkedIn in a headless browser...")
+            try:
+                session_ok = validate_session(args.cookies)
+            except Exception as e:
+                print(f"Warning: Live session check failed to run: {e}")
+            else:
+                if not session_ok:
+                    status["valid"] = False
+                    status["message"] = "LinkedIn rejected the saved session"
+    
+    # Write the status summary in one call rather than a print per line
+    sys.stdout.write(f"""
+Last modified: {status['last_modified']}
+Age: {status['age_hours']:.1f} hours
+Cookie count: {status['cookie_count']}
+Critical auth cookie present: {'✅' if status['li_at_present'] else '❌'}
+Estimated expiration: {status['estimated_expiration']}
+Status: {'✅ Valid' if status['valid'] else '❌ Invalid/Expired'}
+Message: {status['message']}
+""")
     
     if not status["valid"]:
-        print("\n⚠️ Your LinkedIn cookies need to be refreshed!")
-        print("\nYou can refresh cookies with the --interactive flag:")
-        print(f"  python refresh_cookies.py --interactive --output {args.cookies}")
+        sys.stdout.write(f"""
+⚠️ Your LinkedIn cookies need to be refreshed!
+
+You can refresh cookies with the --interactive flag:
+  python refresh_cookies.py --interactive --output {args.cookies}
+""")
         print_cookie_instructions(args.cookies)
     else:
-        remaining_time = datetime.strptime(status["estimated_expiration"], "%Y-%m-%d %H:%M:%S") - datetime.now()
+        remaining_time = status["estimated_expiration_dt"] - datetime.now()
         remaining_minutes = remaining_time.total_seconds() / 60
         print(f"\n✅ Cookies appear valid for approximately {remaining_minutes:.0f} more minutes")
         print("Run your scraper soon before they expire!")
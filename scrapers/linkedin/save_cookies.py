@@ -6,12 +6,20 @@ This script helps you save your LinkedIn cookies to a file for use with the scra
 You'll need to manually log in to LinkedIn when the browser opens.
 """
 
-import json
-import time
 import os
 from pathlib import Path
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+try:
+    from ._json_utils import dumps as _dumps
+    from ._browser import build_stealth_options, apply_stealth_cdp, is_logged_in, get_linkedin_cookies
+except ImportError:
+    from _json_utils import dumps as _dumps
+    from _browser import build_stealth_options, apply_stealth_cdp, is_logged_in, get_linkedin_cookies
 
 
 def save_linkedin_cookies(output_path="cookies.json"):
@@ -26,69 +34,41 @@ def save_linkedin_cookies(output_path="cookies.json"):
     input("Press Enter to continue...")
     
     # Initialize browser with anti-detection measures
-    options = Options()
-    
-    # Anti-detection measures
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_experimental_option('excludeSwitches', ['enable-automation'])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    # Basic browser settings
-    options.add_argument('--start-maximized')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    # Set a realistic user agent
-    options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
-    
-    driver = webdriver.Chrome(options=options)
-    
-    # Apply additional anti-detection measures
-    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-        "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "platform": "macOS"
-    })
-    
-    # Execute JS to modify navigator properties to avoid detection
-    driver.execute_script("""
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        });
-    """)
+    driver = webdriver.Chrome(options=build_stealth_options())
+    apply_stealth_cdp(driver)
     
     try:
-        # Go to LinkedIn
-        driver.get("https://www.linkedin.com/")
-        
-        # Wait for user to log in
-        print("\nPlease log in to LinkedIn in the browser window...")
-        
-        # Wait until we detect the user is logged in
-        logged_in = False
-        max_wait_time = 300  # 5 minutes
-        start_time = time.time()
-        
-        while not logged_in and (time.time() - start_time) < max_wait_time:
-            # Check if we're logged in by looking for feed or profile elements
-            if ("feed" in driver.current_url or 
-                "mynetwork" in driver.current_url or 
-                "messaging" in driver.current_url or
-                "Sign in" not in driver.page_source):
-                logged_in = True
-            else:
-                time.sleep(2)
-        
-        if not logged_in:
-            print("\nTimeout: Could not detect successful login.")
-            return False
+        # The persistent profile is often still logged in from the last run
+        if is_logged_in(driver):
+            print("\nExisting LinkedIn session found, skipping login")
+        else:
+            # Go to LinkedIn
+            driver.get("https://www.linkedin.com/")
+            
+            # Wait for user to log in
+            print("\nPlease log in to LinkedIn in the browser window...")
+            
+            # Wait up to 5 minutes for a logged-in page or the nav bar, returning
+            # as soon as either appears instead of polling on a fixed interval
+            try:
+                WebDriverWait(driver, 300).until(
+                    EC.any_of(
+                        EC.url_contains("feed"),
+                        EC.url_contains("mynetwork"),
+                        EC.url_contains("messaging"),
+                        EC.presence_of_element_located((By.ID, "global-nav"))
+                    )
+                )
+            except TimeoutException:
+                print("\nTimeout: Could not detect successful login.")
+                return False
         
-        # Get cookies
-        cookies = driver.get_cookies()
+        # Get cookies for every LinkedIn subdomain in one CDP round trip
+        cookies = get_linkedin_cookies(driver)
         
         # Save cookies to file
-        with open(output_path, 'w') as f:
-            json.dump(cookies, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(cookies))
         
         print(f"\nSuccess! Cookies saved to {output_path}")
         print("You can now use these cookies with the LinkedIn scraper.")
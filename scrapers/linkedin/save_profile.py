@@ -7,45 +7,90 @@ It's designed to be used after running the LinkedIn scraper, which outputs
 profile data to the terminal but may have issues saving it directly.
 """
 
-import json
-import sys
 import os
-import re
+import sys
+import mmap
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    from ._json_utils import dumps as _dumps, loads as _loads, iter_json_objects
+except ImportError:
+    from _json_utils import dumps as _dumps, loads as _loads, iter_json_objects
+
+def _iter_code_blocks(text):
+    """
+    Yield the contents of fenced ```json code blocks in text
+    
+    Args:
+        text (str or bytes-like): Text that may contain fenced code blocks
+        
+    Yields:
+        str or bytes: Stripped contents of each code block
+    """
+    fence, opening = ('```', '```json') if isinstance(text, str) else (b'```', b'```json')
+    start = text.find(opening)
+    while start != -1:
+        end = text.find(fence, start + 7)
+        if end == -1:
+            return
+        yield text[start + 7:end].strip()
+        start = text.find(opening, end + 3)
+
+def _parse_profile(candidate):
+    """
+    Parse a candidate JSON string as LinkedIn profile data
+    
+    Args:
+        candidate (str or bytes): Candidate JSON string
+        
+    Returns:
+        dict: Profile data or None if the candidate isn't a profile
+    """
+    # Captures can contain invalid UTF-8, which the parser would reject
+    if isinstance(candidate, bytes):
+        candidate = candidate.decode('utf-8', errors='replace')
+    
+    try:
+        data = _loads(candidate)
+    except ValueError:
+        return None
+    
+    # Verify it's a LinkedIn profile by checking for expected keys
+    if isinstance(data, dict) and "basic_info" in data:
+        return data
+    return None
+
 def extract_json_from_text(text):
     """
-    Extract JSON data from text using regex patterns
+    Extract JSON data from text
+    
+    Fenced ```json code blocks are tried first, then every balanced JSON
+    object in the text, stopping at the first profile.
     
     Args:
-        text (str): Text containing JSON data
+        text (str or bytes-like): Text containing JSON data
         
     Returns:
         dict: Extracted JSON data or None if not found
     """
-    # Try to find JSON data in the text using various patterns
-    json_patterns = [
-        r'```json\s*(.*?)\s*```',  # JSON in code block
-        r'\{[\s\S]*"basic_info"[\s\S]*\}',  # Any JSON containing basic_info
-        r'\{[\s\S]*"name"[\s\S]*\}'  # Any JSON containing name
-    ]
+    # _parse_profile only accepts objects with basic_info, so a plain substring
+    # search rejects unrelated input before any scanning. find() is used rather
+    # than `in` because mmap objects don't support substring membership.
+    basic_info = '"basic_info"' if isinstance(text, str) else b'"basic_info"'
+    if text.find(basic_info) == -1:
+        return None
+    
+    for candidate in _iter_code_blocks(text):
+        data = _parse_profile(candidate)
+        if data:
+            return data
     
-    for pattern in json_patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-        for match in matches:
-            try:
-                # Clean up the match to handle potential issues
-                json_str = match if '{' in match else match
-                # Remove any leading/trailing whitespace or quotes
-                json_str = json_str.strip().strip('"\'')
-                # Try to parse as JSON
-                data = json.loads(json_str)
-                # Verify it's a LinkedIn profile by checking for expected keys
-                if "basic_info" in data:
-                    return data
-            except json.JSONDecodeError:
-                continue
+    for candidate in iter_json_objects(text):
+        data = _parse_profile(candidate)
+        if data:
+            return data
     
     return None
 
@@ -61,12 +106,17 @@ def save_profile_data(profile_data, output_path):
         bool: True if successful, False otherwise
     """
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        path = Path(output_path)
+        
+        # Create directory if it doesn't exist (a bare filename has none)
+        if path.parent != Path('.'):
+            path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write the data to the file
-        with open(output_path, 'w') as f:
-            json.dump(profile_data, indent=2, fp=f)
+        # Write to a temporary file and move it into place so a crash
+        # mid-write can't leave a truncated profile behind
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_bytes(_dumps(profile_data))
+        os.replace(temp_path, path)
         
         print(f"Profile data saved to {output_path}")
         return True
@@ -74,20 +124,42 @@ def save_profile_data(profile_data, output_path):
         print(f"Error saving profile data: {str(e)}")
         return False
 
-def extract_from_clipboard():
+@contextmanager
+def _load_input(args):
     """
-    Extract profile data from clipboard
+    Load the input text as bytes from the clipboard, a file, or stdin
     
-    Returns:
-        dict: Extracted profile data or None if not found
+    Files are memory-mapped, so the mapping is only valid inside the
+    with block.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        
+    Yields:
+        bytes-like: Input text, or None if the clipboard is unavailable
     """
-    try:
-        import pyperclip
-        clipboard_text = pyperclip.paste()
-        return extract_json_from_text(clipboard_text)
-    except ImportError:
-        print("pyperclip not installed. Cannot extract from clipboard.")
-        return None
+    if args.clipboard:
+        print("Extracting profile data from clipboard...")
+        try:
+            import pyperclip
+        except ImportError:
+            print("pyperclip not installed. Cannot extract from clipboard.")
+            yield None
+            return
+        yield pyperclip.paste().encode('utf-8', 'replace')
+    elif args.input:
+        print(f"Reading from file: {args.input}")
+        with open(args.input, 'rb') as f:
+            # Map the file rather than reading it, so long captures are scanned
+            # in place and only candidate objects get copied and decoded
+            if not os.fstat(f.fileno()).st_size:
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+    else:
+        print("Paste the terminal output containing JSON data (Ctrl+D to finish):")
+        yield sys.stdin.buffer.read()
 
 def main():
     parser = argparse.ArgumentParser(description="Save LinkedIn profile data from terminal output")
@@ -97,26 +169,16 @@ def main():
     
     args = parser.parse_args()
     
-    # Get profile data from clipboard, file, or stdin
+    # Get profile data from clipboard, file, or stdin, always as bytes
     profile_data = None
-    
-    if args.clipboard:
-        print("Extracting profile data from clipboard...")
-        profile_data = extract_from_clipboard()
-    elif args.input:
-        print(f"Reading from file: {args.input}")
-        with open(args.input, 'r') as f:
-            text = f.read()
-        profile_data = extract_json_from_text(text)
-    else:
-        print("Paste the terminal output containing JSON data (Ctrl+D to finish):")
-        text = sys.stdin.read()
-        profile_data = extract_json_from_text(text)
+    with _load_input(args) as data:
+        if data is not None:
+            profile_data = extract_json_from_text(data)
     
     # Save the profile data if found
     if profile_data:
         print("Successfully extracted profile data:")
-        print(json.dumps(profile_data, indent=2))
+        print(_dumps(profile_data).decode('utf-8'))
         
         # Save the profile data
         save_profile_data(profile_data, args.output)
@@ -9,22 +9,900 @@ with a pre-authenticated session via cookies.
 import json
 import time
 import os
+import re
 import random
-from datetime import datetime
+import shutil
+import atexit
+import queue
+import threading
+import copy
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib.request import urlopen
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+try:
+    from ._json_utils import dumps as _dumps, loads as _loads
+    from ._browser import to_cdp_cookie
+except ImportError:
+    from _json_utils import dumps as _dumps, loads as _loads
+    from _browser import to_cdp_cookie
+
+# Fetching profile HTML over plain HTTP needs httpx and selectolax; without
+# them every profile is rendered in the browser
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
+    HTTP_SCRAPING_AVAILABLE = True
+except ImportError:
+    HTTP_SCRAPING_AVAILABLE = False
+
+# A direct DevTools connection needs websocket-client; without it CDP
+# commands go through Selenium one at a time
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+# HTTP/2 in httpx needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# User agents sent by each browser; the Chrome one is reused for plain HTTP requests
+_CHROME_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+_FIREFOX_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/115.0"
+
+# Search pages used as the referrer, so the visit looks like it came from a search
+_REFERRERS = (
+    "https://www.google.com/search?q=linkedin+profile",
+    "https://www.bing.com/search?q=linkedin+login",
+    "https://duckduckgo.com/?q=linkedin"
+)
+
+# Chrome features the scraper never uses; turning them off trims startup and memory
+_DISABLED_CHROME_FEATURES = (
+    'Translate', 'BackForwardCache', 'AcceptCHFrame', 'MediaRouter', 'OptimizationHints',
+    'InterestFeedContentSuggestions', 'CalculateNativeWinOcclusion'
+)
+
+# Background work Chrome does at startup that a scraping session doesn't need
+_CHROME_STARTUP_FLAGS = (
+    '--disable-background-networking',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--no-pings',
+    '--mute-audio',
+)
+
+# Requests Chrome drops before they reach the network: images, fonts, media
+# and third-party trackers that the scraper never reads
+_BLOCKED_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.woff*', '*.mp4',
+    '*google-analytics*', '*doubleclick*', '*hotjar*', '*fullstory*', '*linkedin.com/li/track*'
+]
+
+# Navigation elements that only render for a logged-in member
+_LOGGED_IN_SELECTOR = 'div.global-nav__me, a[data-test-global-nav-link="feed"], #global-nav'
+
+# Shown when the cookie file is missing; filled in with str.format
+_COOKIE_HELP_TEXT = """
+To create a new cookies.json file, run one of these commands:
+  python {script_dir}/save_cookies.py --output {cookies_path}
+  python {script_dir}/refresh_cookies.py --interactive --output {cookies_path}
+
+Or follow these manual steps:
+1. Open Chrome and log in to LinkedIn
+2. Use a browser extension like 'EditThisCookie' to export cookies
+3. Save the cookies to cookies.json"""
+
+# Page paths LinkedIn only serves to logged-in members
+_MEMBER_URL_PREFIXES = ('/feed', '/mynetwork', '/in/')
+
+# Cookies LinkedIn can't authenticate without
+_CRITICAL_COOKIES = frozenset(('li_at', 'JSESSIONID'))
+
+# Session cookies LinkedIn needs to serve a logged-in profile page
+_HTTP_SESSION_COOKIES = ('li_at', 'JSESSIONID', 'bcookie', 'bscookie', 'lidc')
+
+# Navigation errors that usually go away on a retry; anything else fails fast
+_TRANSIENT_NAVIGATION_ERRORS = (
+    'net::ERR_TIMED_OUT', 'net::ERR_CONNECTION_RESET', 'net::ERR_CONNECTION_CLOSED',
+    'net::ERR_NETWORK_CHANGED', 'net::ERR_INTERNET_DISCONNECTED', 'disconnected'
+)
+
+# URL fragments LinkedIn redirects to when it wants a login or a challenge
+_CHALLENGE_URL_FRAGMENTS = ('/authwall', '/checkpoint', '/login', '/uas/')
+
+# Page text that shows LinkedIn wants a login (negative signal)
+_LOGIN_INDICATORS = (
+    "Sign in", "Join now", "Sign in with Google", "New to LinkedIn?",
+    "Join LinkedIn", "Email or phone", "Forgot password", "Sign in to LinkedIn"
+)
+
+# Page elements only shown to logged-in members (positive signal)
+_MEMBER_INDICATORS = (
+    "feed-identity-module", "identity-headline", "identity-name", "profile-rail",
+    "global-nav-me", "mynetwork", "messaging", "notifications", "premium-upsell-button",
+    "groups-entity", "jobs-home", "feed-tab-icon", "nav-settings__dropdown"
+)
+
+# Page elements only shown to premium members (strong positive signal)
+_PREMIUM_INDICATORS = (
+    "premium-upsell", "premium-badge", "premium-icon", "sales-nav", "recruiter-nav"
+)
+
+# XPaths tried in order for each part of a rendered profile page. They're
+# module constants so scrape_profile doesn't rebuild the lists on every call.
+
+# Profile name, best match first
+_NAME_XPATHS = (
+    '//h1[contains(@class, "text-heading-xlarge")]',
+    '//h1[contains(@class, "ember-view")]',
+    '//h1',
+    '//div[contains(@class, "pv-text-details__left-panel")]/div[1]',
+    '//div[contains(@class, "display-flex")]/h1',
+    '//div[contains(@class, "profile-info")]/h1',
+    '//div[contains(@class, "profile-header")]//h1',
+    '//*[contains(@class, "profile-info")]//*[contains(@class, "name")]'
+)
+
+# Profile headline
+_HEADLINE_XPATHS = (
+    '//div[contains(@class, "text-body-medium") and not(contains(@class, "visually-hidden"))]',
+    '//div[contains(@class, "pv-text-details__left-panel")]/div[2]',
+    '//div[contains(@class, "ph5")]/div[2]',
+    '//div[contains(@class, "display-flex")]/div[contains(@class, "text-body")]',
+    '//div[contains(@class, "profile-info")]/div[contains(@class, "headline")]',
+    '//*[contains(@class, "profile-info")]//*[contains(@class, "headline")]',
+    '//*[contains(@class, "pv-top-card")]//*[contains(@class, "text-body-medium")]',
+    '//div[@aria-label="Profile information"]/div[2]',
+    '//div[contains(@class, "profile-header")]/div[2]'
+)
+
+# Profile location
+_LOCATION_XPATHS = (
+    '//span[contains(@class, "text-body-small")][contains(@class, "inline")]',
+    '//div[contains(@class, "pv-text-details__left-panel")]/span[1]',
+    '//div[contains(@class, "pb2")]/span[1]',
+    '//span[contains(@class, "text-body-small") and contains(text(), "Austin")]'
+)
+
+# About section text, which has to be longer than 5 characters
+_ABOUT_XPATHS = (
+    '//div[contains(@class, "display-flex")][./span[text()="About"]]/following-sibling::div',
+    '//section[.//span[text()="About"]]//div[contains(@class, "display-flex")]/span[1]',
+    '//section[contains(@class, "summary")]//p',
+    '//div[contains(@class, "inline-show-more-text")]'
+)
+
+# Entries of a profile section, relative to the section
+_SECTION_ITEM_XPATHS = (
+    './/ul/li',
+    './/div[contains(@class, "pvs-entity")]',
+    './/div[contains(@class, "display-flex")][.//*[contains(@class, "t-bold")]]'
+)
+
+# Experience section
+_EXPERIENCE_SECTION_XPATHS = (
+    '//section[.//span[text()="Experience"]]',
+    '//section[contains(@class, "experience")]',
+    '//div[contains(@id, "experience")]',
+    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Experience")]]'
+)
+
+# Job title, relative to an experience item
+_EXPERIENCE_TITLE_XPATHS = (
+    './/span[contains(@class, "t-bold")]',
+    './/span[contains(@class, "mr1")][contains(@class, "t-bold")]',
+    './/div[contains(@class, "display-flex")]/span[1]'
+)
+
+# Company, relative to an experience item
+_EXPERIENCE_COMPANY_XPATHS = (
+    './/span[contains(@class, "t-14")][contains(@class, "t-normal")]',
+    './/span[contains(@class, "t-14")][.//*[contains(@aria-hidden, "true")]]',
+    './/div[contains(@class, "display-flex")]/span[2]'
+)
+
+# Dates employed, relative to an experience item
+_EXPERIENCE_DURATION_XPATHS = (
+    './/span[contains(@class, "t-14")][contains(@class, "t-normal")][contains(@class, "t-black--light")]',
+    './/span[contains(text(), "Present")]/..',
+    './/span[contains(text(), "yr")]/..'
+)
+
+# Matches the dates line of an experience item, e.g. "Jan 2020 - Present · 3 yrs 2 mos"
+_DURATION_PATTERN = re.compile(r'\b\d+\s*(?:yrs?|mos?)\b|\bPresent\b', re.I)
+
+# Education section
+_EDUCATION_SECTION_XPATHS = (
+    '//section[.//span[text()="Education"]]',
+    '//section[contains(@class, "education")]',
+    '//div[contains(@id, "education")]',
+    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Education")]]'
+)
+
+# School, relative to an education item
+_EDUCATION_SCHOOL_XPATHS = (
+    './/span[contains(@class, "t-bold")]',
+    './/span[contains(@class, "mr1")][contains(@class, "t-bold")]',
+    './/div[contains(@class, "display-flex")]/span[1]'
+)
+
+# Degree, relative to an education item
+_EDUCATION_DEGREE_XPATHS = (
+    './/span[contains(@class, "t-14")][contains(@class, "t-normal")]',
+    './/span[contains(@class, "t-14")][contains(text(), "Bachelor")]',
+    './/span[contains(@class, "t-14")][contains(text(), "Master")]',
+    './/div[contains(@class, "display-flex")]/span[2]'
+)
+
+# Dates attended, relative to an education item
+_EDUCATION_DATE_XPATHS = (
+    './/span[contains(@class, "t-14")][contains(@class, "t-normal")][contains(@class, "t-black--light")]',
+    './/span[contains(text(), "20")]/..'  # Years typically contain 20xx
+)
+
+# Skills section
+_SKILLS_SECTION_XPATHS = (
+    '//section[.//span[text()="Skills"]]',
+    '//section[contains(@class, "skills")]',
+    '//div[contains(@id, "skills")]',
+    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Skills")]]'
+)
+
+# Skill names, relative to the skills section
+_SKILL_ITEM_XPATHS = (
+    './/span[contains(@class, "t-bold")]',
+    './/span[contains(@class, "display-block")]',
+    './/div[contains(@class, "display-flex")]/span[1]',
+    './/li//span[not(contains(text(), "Show"))]',
+    './/span[contains(@class, "pvs-entity__path-node")]'
+)
+
+# Skill tags and well-known technologies anywhere on the page
+_SKILL_TAG_XPATHS = (
+    '//li[contains(@class, "skill")]//span',
+    '//div[contains(@class, "endorsement")]//span',
+    '//div[contains(@class, "pvs-entity__path-node")]//span',
+    # Common programming languages and technologies
+    '//div[contains(text(), "Python")]',
+    '//div[contains(text(), "JavaScript")]',
+    '//div[contains(text(), "Java")]',
+    '//div[contains(text(), "C++")]',
+    '//div[contains(text(), "SQL")]',
+    '//div[contains(text(), "React")]',
+    '//div[contains(text(), "Node.js")]',
+    '//div[contains(text(), "Git")]',
+    '//div[contains(text(), "Machine Learning")]',
+    '//div[contains(text(), "Data Science")]',
+    '//div[contains(text(), "AWS")]',
+    '//div[contains(text(), "Cloud")]'
+)
+
+
+def _build_indicator_scanner(categories):
+    """Compile every indicator into one case-insensitive pattern
+    
+    The pattern is a lookahead, so it matches at each position where any
+    indicator starts without consuming text and overlapping indicators are
+    all seen. Longer indicators are tried first, and each one also reports
+    the categories of any indicators it contains.
+    
+    Args:
+        categories (dict): Category name mapped to its indicator strings
+        
+    Returns:
+        tuple: (compiled pattern, dict of lowercased indicator to category set)
+    """
+    terms = {}
+    for category, indicators in categories.items():
+        for indicator in indicators:
+            terms.setdefault(indicator.lower(), set()).add(category)
+    
+    hits = {
+        term: frozenset(category for other, cats in terms.items() if other in term for category in cats)
+        for term in terms
+    }
+    alternatives = sorted(terms, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, alternatives)) + '))', re.IGNORECASE)
+    return pattern, hits
+
+
+_AUTH_INDICATOR_PATTERN, _AUTH_INDICATOR_HITS = _build_indicator_scanner({
+    'login': _LOGIN_INDICATORS,
+    'member': _MEMBER_INDICATORS,
+    'premium': _PREMIUM_INDICATORS,
+})
+
+
+def _scan_auth_indicators(page_source):
+    """Find which indicator categories appear in a page, in one pass
+    
+    Args:
+        page_source (str): Page HTML
+        
+    Returns:
+        set: Categories found, out of 'login', 'member' and 'premium'
+    """
+    found = set()
+    for match in _AUTH_INDICATOR_PATTERN.finditer(page_source):
+        found |= _AUTH_INDICATOR_HITS[match.group(1).lower()]
+        if len(found) == 3:
+            break  # Every category is already known
+    return found
+
+
+# Parsed cookie files shared by every scraper in the process, see _read_cookie_file
+_cookie_cache = {}
+_cookie_cache_lock = threading.Lock()
+
+# Scraped profiles shared by every scraper in the process, keyed on URL and
+# cookie state, see LinkedInScraper._cached_result
+_result_cache = {}
+_result_cache_lock = threading.Lock()
+_result_cache_files = set()  # cache.json files already merged into _result_cache
+
+
+def _read_cookie_file(cookies_path, cookie_stat=None):
+    """Parse and validate a cookie file, reusing the result while it's unchanged
+    
+    Scrapers in a pool usually share one cookie file, so the parsed cookies
+    are cached for the whole process, keyed on the file's path, mtime and size.
+    Both LinkedInScraper and scraper_async.py load their cookies through here.
+    
+    Args:
+        cookies_path (str): Path to the cookies.json file
+        cookie_stat (os.stat_result): Result of os.stat on cookies_path, if
+            the caller already has it
+        
+    Returns:
+        tuple: (file data, cookie list, CDP cookie params), or None if the
+            file is unusable
+    
+    Raises:
+        OSError: If cookie_stat isn't given and the file can't be stat'ed
+    """
+    if cookie_stat is None:
+        cookie_stat = os.stat(cookies_path)
+    key = (os.path.abspath(cookies_path), cookie_stat.st_mtime_ns, cookie_stat.st_size)
+    with _cookie_cache_lock:
+        cached = _cookie_cache.get(key)
+    if cached:
+        print(f"Reusing cookies already validated from {cookies_path}")
+        return cached
+    
+    try:
+        with open(cookies_path, 'rb') as f:
+            data = _loads(f.read())
+    except OSError as e:
+        print(f"❌ Error: Could not read cookie file: {e}")
+        return None
+    except ValueError as e:
+        # Also covers invalid UTF-8, which the stdlib parser reports as UnicodeDecodeError
+        print(f"❌ Error: Cookie file is not valid JSON: {e}")
+        print("Please recreate your cookies file using save_cookies.py")
+        return None
+    
+    # Check if this is the new enhanced session format or old format
+    if isinstance(data, dict) and 'cookies' in data and 'version' in data:
+        print(f"Detected enhanced session data format v{data['version']}")
+        cookies = data['cookies']
+        
+        # Extract session creation time if available
+        if 'created_at' in data:
+            print(f"Session created: {data['created_at']}")
+    else:
+        # Legacy format - just a list of cookies
+        cookies = data
+        print("Using legacy cookie format")
+        
+    if not cookies or not isinstance(cookies, list):
+        print("❌ Error: Cookie file has invalid format (empty or not a list)")
+        print("Please recreate your cookies file using save_cookies.py")
+        return None
+        
+    # Validate critical LinkedIn cookies are present
+    cookie_names = {cookie.get('name') for cookie in cookies}
+    found_critical = _CRITICAL_COOKIES & cookie_names
+    
+    if not found_critical:
+        print("❌ Error: No critical LinkedIn authentication cookies found")
+        print("Please recreate your cookies file using save_cookies.py")
+        return None
+    elif len(found_critical) < len(_CRITICAL_COOKIES):
+        missing = _CRITICAL_COOKIES - found_critical
+        print(f"⚠️ Warning: Missing some important cookies: {', '.join(missing)}")
+        print("Authentication may fail or have limited functionality")
+        
+    # Ensure domain is set correctly for LinkedIn cookies
+    for cookie in cookies:
+        if 'domain' not in cookie or not cookie['domain']:
+            cookie['domain'] = '.linkedin.com'
+    
+    entry = (data, cookies, [to_cdp_cookie(cookie) for cookie in cookies])
+    with _cookie_cache_lock:
+        _cookie_cache[key] = entry
+    return entry
+
+
+def _check_cookie_age(cookies_path, cookie_stat, prompt=True):
+    """Warn about old cookies and offer to refresh them when they're likely expired
+    
+    Args:
+        cookies_path (str): Path to the cookies.json file
+        cookie_stat (os.stat_result): Result of os.stat on cookies_path
+        prompt (bool): Whether to ask the user about refreshing cookies that
+            are over two hours old
+        
+    Returns:
+        bool: True if the cookies were refreshed and need to be loaded again
+    """
+    # Enhanced cookie validation with more detailed warnings
+    cookie_age = time.time() - cookie_stat.st_mtime
+    cookie_age_hours = cookie_age / 3600
+    cookie_age_minutes = cookie_age / 60
+    
+    if cookie_age_hours > 2:
+        print(f"⚠️ WARNING: Cookie file is {cookie_age_hours:.1f} hours old (HIGH RISK)")
+        print("LinkedIn cookies typically expire after 1-2 hours when used for scraping")
+        print("Consider refreshing your cookies before proceeding")
+        if not prompt:
+            return False
+        refresh_response = input("Would you like to refresh cookies now? (y/n): ").lower()
+        if refresh_response == 'y':
+            try:
+                # Import refresh_cookies dynamically to avoid circular imports
+                import importlib.util
+                spec = importlib.util.spec_from_file_location(
+                    "refresh_cookies", 
+                    os.path.join(os.path.dirname(__file__), "refresh_cookies.py")
+                )
+                refresh_module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(refresh_module)
+                
+                # Call the extract_cookies_from_browser function
+                print("\nLaunching browser to refresh cookies...")
+                if refresh_module.extract_cookies_from_browser(cookies_path, headless=False):
+                    print("Cookies refreshed successfully!")
+                    return True
+                else:
+                    print("Failed to refresh cookies. Continuing with existing cookies...")
+            except Exception as e:
+                print(f"Error refreshing cookies: {e}")
+                print("Continuing with existing cookies...")
+    elif cookie_age_hours > 1:
+        print(f"⚠️ WARNING: Cookie file is {cookie_age_hours:.1f} hours old (MEDIUM RISK)")
+    elif cookie_age_minutes > 30:
+        print(f"ℹ️ Cookie file is {cookie_age_minutes:.1f} minutes old (LOW RISK)")
+    else:
+        print(f"✅ Cookie file is fresh ({cookie_age_minutes:.1f} minutes old)")
+    
+    return False
+
+
+class _SharedServiceChrome(webdriver.Remote):
+    """Chrome session on the shared chromedriver service
+    
+    webdriver.Remote has no execute_cdp_cmd, so it is forwarded to
+    chromedriver's CDP endpoint the same way webdriver.Chrome does it.
+    """
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class _CdpConnection:
+    """Direct DevTools websocket to a page, used to send CDP commands in batches
+    
+    Overrides such as the user agent, injected scripts and blocked URLs only
+    last while the session that set them is attached, so the connection stays
+    open for the life of the browser. A reader thread collects replies and
+    throws away events so they never pile up.
+    """
+    
+    def __init__(self, websocket_url, timeout=10):
+        self.timeout = timeout
+        # Chrome rejects websocket clients that send an Origin header
+        self._ws = websocket.create_connection(websocket_url, suppress_origin=True)
+        self._next_id = 0
+        self._replies = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+        
+    @classmethod
+    def for_driver(cls, driver):
+        """Connect to the page target of a running Chrome session
+        
+        Returns:
+            _CdpConnection: Open connection, or None if Chrome exposes no page target
+        """
+        address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
+        if not address:
+            return None
+        with urlopen(f'http://{address}/json/list', timeout=5) as response:
+            targets = _loads(response.read())
+        page = next((t for t in targets if t.get('type') == 'page' and t.get('webSocketDebuggerUrl')), None)
+        if page is None:
+            return None
+        return cls(page['webSocketDebuggerUrl'])
+        
+    def _read_replies(self):
+        """Store command replies as they arrive and drop everything else"""
+        try:
+            while True:
+                message = _loads(self._ws.recv())
+                if 'id' in message:
+                    with self._condition:
+                        self._replies[message['id']] = message
+                        self._condition.notify_all()
+        except Exception:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+                
+    def send_batch(self, commands):
+        """Send every command before waiting for any reply
+        
+        Args:
+            commands (list): (method, params) pairs
+            
+        Returns:
+            list: Each command's result, in order
+        """
+        with self._condition:
+            if self._closed:
+                raise ConnectionError("DevTools connection is closed")
+            ids = []
+            for method, params in commands:
+                self._next_id += 1
+                ids.append(self._next_id)
+                self._ws.send(json.dumps({'id': self._next_id, 'method': method, 'params': params}))
+            
+            done = self._condition.wait_for(
+                lambda: self._closed or all(i in self._replies for i in ids), self.timeout
+            )
+            if not done or not all(i in self._replies for i in ids):
+                raise ConnectionError("No reply from DevTools")
+            replies = [self._replies.pop(i) for i in ids]
+        
+        results = []
+        for (method, _), reply in zip(commands, replies):
+            if 'error' in reply:
+                raise RuntimeError(f"{method} failed: {reply['error'].get('message')}")
+            results.append(reply.get('result', {}))
+        return results
+        
+    def close(self):
+        """Close the websocket, which also stops the reader thread"""
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+# One chromedriver process serves every Chrome session in this process
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def _shared_service_url():
+    """Start the shared chromedriver service on first use
+    
+    Returns:
+        str: URL of the running service, or None if chromedriver isn't on
+            PATH or wouldn't start
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            executable = shutil.which('chromedriver')
+            if not executable:
+                return None
+            try:
+                service = Service(executable_path=executable, port=0)
+                service.start()
+            except Exception as e:
+                print(f"Could not start shared chromedriver, using one per browser: {e}")
+                return None
+            atexit.register(service.stop)
+            _shared_service = service
+        return _shared_service.service_url
+
+
+def _first_text(node, selectors):
+    """Return the stripped text of the first selector match with real content"""
+    for selector in selectors:
+        match = node.css_first(selector)
+        if match is not None:
+            text = match.text(strip=True)
+            if text and len(text) > 1:
+                return text
+    return None
+
+
+def _classify_experience_lines(lines):
+    """Read title, company and duration from the text lines of an experience item
+    
+    Args:
+        lines (list): The item's text, split into lines
+        
+    Returns:
+        dict: title, company and duration, or None if the lines don't follow
+            the usual title / company / dates layout
+    """
+    # Drop blank lines and the repeats LinkedIn renders for screen readers
+    cleaned = []
+    for line in lines:
+        line = line.strip()
+        if line and (not cleaned or cleaned[-1] != line):
+            cleaned.append(line)
+    if len(cleaned) < 3 or _DURATION_PATTERN.search(cleaned[1]):
+        return None
+    
+    duration = next((line for line in cleaned[2:] if _DURATION_PATTERN.search(line)), None)
+    if duration is None:
+        return None
+    return {"title": cleaned[0], "company": cleaned[1].split(' · ')[0], "duration": duration}
+
+
+def _parse_section_items(tree, anchor_id, fields):
+    """Parse up to three entries of a profile card such as experience or education
+    
+    Args:
+        tree: Parsed profile page
+        anchor_id (str): id of the card's anchor element, e.g. "experience"
+        fields (tuple): Keys for the first lines of each entry, in order
+        
+    Returns:
+        list: Dicts keyed by fields
+    """
+    anchor = tree.css_first(f'#{anchor_id}')
+    section = anchor.parent if anchor is not None else None
+    if section is None:
+        return []
+    
+    entries = []
+    for item in section.css('ul > li')[:3]:
+        # LinkedIn repeats each line in a visually-hidden span, so only the
+        # aria-hidden copies are read
+        lines = [span.text(strip=True) for span in item.css('span[aria-hidden="true"]')]
+        lines = [line for line in lines if line]
+        if not lines:
+            continue
+        entries.append({field: (lines[i] if i < len(lines) else "Not found") for i, field in enumerate(fields)})
+    return entries
+
+
+def _parse_profile_html(html):
+    """Extract profile fields from a server-rendered profile page
+    
+    Args:
+        html (str): Profile page HTML
+        
+    Returns:
+        dict: Profile information in the same shape as scrape_profile, or None
+            if the page has no profile name
+    """
+    tree = LexborHTMLParser(html)
+    name = _first_text(tree, ['h1.text-heading-xlarge', 'main h1', 'h1'])
+    if not name:
+        return None
+    
+    return {
+        "basic_info": {
+            "name": name,
+            "headline": _first_text(tree, ['div.text-body-medium', '.pv-text-details__left-panel div:nth-child(2)']) or "Not found",
+            "location": _first_text(tree, ['span.text-body-small.inline', '.pv-text-details__left-panel span']) or "Not found",
+        },
+        "about": _first_text(tree, ['#about ~ div .inline-show-more-text span[aria-hidden="true"]', 'div.inline-show-more-text']) or "",
+        "experience": _parse_section_items(tree, "experience", ("title", "company", "duration")),
+        "education": _parse_section_items(tree, "education", ("school", "degree", "dates")),
+        "skills": [],
+        "interests": []
+    }
 
 
 class LinkedInScraper:
     """LinkedIn profile scraper using Selenium with cookie-based authentication"""
     
-    def __init__(self, cookies_path=None, headless=True, browser_options=None, browser_type='chrome'):
+    # Navigator patches installed in Chrome before any page script runs
+    _STEALTH_JS = r"""
+        // Hide the webdriver flag
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+        
+        // Overwrite the 'plugins' property to use a custom getter
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5]
+        });
+        
+        // Overwrite the 'languages' property to use a custom getter
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en', 'es']
+        });
+        
+        // Modify the permission state
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+                Promise.resolve({ state: Notification.permission }) :
+                originalQuery(parameters)
+        );
+    """
+    
+    # Mouse movement and a smooth scroll so the session doesn't look scripted.
+    # Wrapped in a function so it can be evaluated more than once per page.
+    _HUMAN_BEHAVIOR_JS = """
+        (() => {
+            // Simplified mouse movement and scrolling - optimized for speed
+            // Just enough to avoid basic bot detection
+            
+            // Simple mouse movement simulation
+            const simpleMouseMovement = () => {
+                // Create and dispatch a few mouse events at random positions
+                for (let i = 0; i < 3; i++) {
+                    const x = Math.floor(Math.random() * window.innerWidth);
+                    const y = Math.floor(Math.random() * window.innerHeight);
+                    
+                    const event = new MouseEvent('mousemove', {
+                        'view': window,
+                        'bubbles': true,
+                        'cancelable': true,
+                        'clientX': x,
+                        'clientY': y
+                    });
+                    document.dispatchEvent(event);
+                }
+            };
+            
+            // Quick scroll simulation
+            const quickScroll = () => {
+                // Single smooth scroll down
+                window.scrollBy({
+                    top: 300 + Math.floor(Math.random() * 200),
+                    behavior: 'smooth'
+                });
+            };
+            
+            // Execute minimal interactions - just enough to avoid detection
+            simpleMouseMovement();
+            quickScroll();
+        })();
+    """
+    
+    # Resolves the first matching XPath with enough text for each profile field
+    # in a single round trip. Takes the name, headline, location and about
+    # selector lists as arguments and returns the fields, plus the XPaths that
+    # matched, as a JSON string.
+    _BASIC_INFO_JS = """
+        const matched = [];
+        const firstText = (selectors, minLength) => {
+            for (const selector of selectors) {
+                let node = null;
+                try {
+                    node = document.evaluate(
+                        selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                    ).singleNodeValue;
+                } catch (e) {
+                    continue;
+                }
+                const text = node ? (node.innerText || node.textContent || '').trim() : '';
+                if (text.length > minLength) {
+                    matched.push(selector);
+                    return text;
+                }
+            }
+            return '';
+        };
+        return JSON.stringify({
+            name: firstText(arguments[0], 1),
+            headline: firstText(arguments[1], 1),
+            location: firstText(arguments[2], 1),
+            about: firstText(arguments[3], 5),
+            matched: matched
+        });
+    """
+    
+    # Reads the items of a profile section (experience, education) in a single
+    # round trip. Takes the section element, the item XPaths to try, a mapping
+    # of field name to XPaths relative to each item and the maximum number of
+    # items. Returns a JSON string with the matching item XPath, the total item
+    # count and, per item, the first non-empty text for each field plus the
+    # item's text lines for fallback parsing. An empty mapping reads just the lines.
+    _SECTION_ITEMS_JS = """
+        const [section, itemSelectors, fields, limit] = arguments;
+        const evaluate = (selector, context, type) =>
+            document.evaluate(selector, context, null, type, null);
+        for (const itemSelector of itemSelectors) {
+            const found = evaluate(itemSelector, section, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+            if (!found.snapshotLength) {
+                continue;
+            }
+            const items = [];
+            for (let i = 0; i < Math.min(found.snapshotLength, limit); i++) {
+                const item = found.snapshotItem(i);
+                const row = {lines: (item.innerText || '').split('\\n')};
+                for (const [field, selectors] of Object.entries(fields)) {
+                    for (const selector of selectors) {
+                        const node = evaluate(selector, item, XPathResult.FIRST_ORDERED_NODE_TYPE).singleNodeValue;
+                        const text = node ? (node.innerText || '').trim() : '';
+                        if (text) {
+                            row[field] = text;
+                            break;
+                        }
+                    }
+                }
+                items.push(row);
+            }
+            return JSON.stringify({selector: itemSelector, total: found.snapshotLength, items: items});
+        }
+        return JSON.stringify({selector: null, total: 0, items: []});
+    """
+    
+    # Async script that scrolls down one screen at a time so lazy-loaded
+    # sections render, stops once the bottom is reached and the page height
+    # has stayed the same for two steps (or after 5 seconds), then scrolls back
+    # to the top. Passes the final page height to the callback.
+    _SCROLL_JS = """
+        const done = arguments[arguments.length - 1];
+        const pause = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+        (async () => {
+            const deadline = Date.now() + 5000;
+            let stableSteps = 0;
+            while (stableSteps < 2 && Date.now() < deadline) {
+                const height = document.body.scrollHeight;
+                window.scrollBy(0, window.innerHeight);
+                await pause(100);
+                const atBottom = window.scrollY + window.innerHeight >= height - 2;
+                stableSteps = atBottom && document.body.scrollHeight === height ? stableSteps + 1 : 0;
+            }
+            window.scrollTo(0, 0);
+            done(document.body.scrollHeight);
+        })();
+    """
+    
+    # Async script that checks every XPath each poll until one matches or the
+    # timeout passes. Passes [element, selector] to the callback, or null.
+    _FIND_ANY_JS = """
+        const [selectors, timeoutMs, done] = arguments;
+        const deadline = Date.now() + timeoutMs;
+        const poll = () => {
+            for (const selector of selectors) {
+                const node = document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (node) {
+                    done([node, selector]);
+                    return;
+                }
+            }
+            if (Date.now() >= deadline) {
+                done(null);
+                return;
+            }
+            setTimeout(poll, 100);
+        };
+        poll();
+    """
+    
+    def __init__(self, cookies_path=None, headless=True, browser_options=None, browser_type='chrome', user_data_dir=None, block_images=True,
+                 persist_results=False):
         """
         Initialize the LinkedIn scraper
         
@@ -33,18 +911,163 @@ class LinkedInScraper:
             headless (bool): Whether to run the browser in headless mode
             browser_options: Custom browser options to use (optional)
             browser_type (str): Type of browser to use ('chrome' or 'firefox')
+            user_data_dir (str): Chrome profile directory (defaults to ~/.linkedin_chrome_profile)
+            block_images (bool): Whether to block images, fonts, media and trackers in Chrome
+            persist_results (bool): Whether scraped profiles are also kept in cache.json
+                next to the cookie file, so other processes can reuse them
         """
         self.cookies_path = cookies_path
+        # Screenshots and other debug output go next to the cookie file
+        self._artifact_dir = Path(cookies_path).parent if cookies_path else Path('.')
+        self.user_data_dir = user_data_dir
+        self.block_images = block_images
         self.headless = headless
         self.driver = None
         self.browser_options = browser_options
         self.browser_type = browser_type.lower()  # Normalize to lowercase
         self.cookie_max_age = 3600  # Maximum age of cookies in seconds (1 hour)
-        self.page_load_timeout = 20  # Maximum time to wait for page load in seconds
+        self.prompt_refresh = True  # Whether load_cookies asks to refresh cookies over two hours old
+        self.page_load_timeout = 10  # Maximum time to wait for DOMContentLoaded in seconds
         self.element_timeout = 5  # Maximum time to wait for elements in seconds
+        self._authenticated = None  # None until cookies have been loaded into the session
+        self.use_http = True  # Try plain HTTP before rendering profiles in the browser
+        self._cdp = None  # Direct DevTools connection, opened on first use
+        self._http = None  # HTTP client sharing the browser's session, created on first use
+        self._screenshot_dir_ready = False  # Whether debug_screenshots has been created
+        self._homepage_checked = False  # Whether this browser session passed the homepage check
+        self._io_pool = None  # Writes debug screenshots in the background, created on first use
+        self._selector_hits = Counter()  # How often each XPath matched, so the best ones are tried first
+        self.result_ttl = 3600  # Seconds a scraped profile is reused before it's scraped again
+        self.persist_results = persist_results
+        
+    @classmethod
+    def connect_existing(cls, debugger_address="127.0.0.1:9222", cookies_path=None):
+        """
+        Attach to a Chrome instance that is already running with remote debugging
+        
+        Start Chrome with --remote-debugging-port=9222 first. The browser is
+        reused as-is, so launching and logging in are skipped entirely.
+        
+        Args:
+            debugger_address (str): host:port of Chrome's remote debugging endpoint
+            cookies_path (str): Cookies to load into the session, or None to
+                trust the browser's existing LinkedIn login
+            
+        Returns:
+            LinkedInScraper: Scraper bound to the running browser
+        """
+        scraper = cls(cookies_path=cookies_path, headless=False, browser_type='chrome')
+        options = Options()
+        options.debugger_address = debugger_address
+        scraper.driver = webdriver.Chrome(options=options)
+        scraper.driver.set_page_load_timeout(scraper.page_load_timeout)
+        if cookies_path is None:
+            scraper._authenticated = True
+        return scraper
+        
+    def _cdp_pipeline(self, commands):
+        """Run CDP commands as one batch over a direct DevTools connection
+        
+        Falls back to sending them one by one through Selenium when
+        websocket-client is missing or Chrome can't be reached directly.
+        
+        Args:
+            commands (list): (method, params) pairs
+            
+        Returns:
+            list: Each command's result, in order
+        """
+        if self._cdp is None and WEBSOCKET_AVAILABLE:
+            try:
+                self._cdp = _CdpConnection.for_driver(self.driver)
+            except Exception as e:
+                print(f"Direct DevTools connection unavailable, using Selenium for CDP: {e}")
+                self._cdp = False
+        
+        if self._cdp:
+            return self._cdp.send_batch(commands)
+        return [self.driver.execute_cdp_cmd(method, params) for method, params in commands]
+        
+    def ensure_session(self):
+        """
+        Start the browser and load cookies once, reusing them on later calls
         
+        Returns:
+            bool: True if the session is authenticated
+        """
+        if not self.driver:
+            self.start_browser()
+            self._authenticated = None
+            self._homepage_checked = False
+        if self._authenticated is None:
+            self._authenticated = self.load_cookies()
+        return self._authenticated
+        
+    def _wait_loaded(self, sentinel_xpath, timeout=5):
+        """
+        Wait until the document has been parsed and the sentinel element is present
+        
+        Args:
+            sentinel_xpath (str): XPath of an element that marks the page as usable
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if the page loaded before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script('return document.readyState') != 'loading'
+                and d.find_elements(By.XPATH, sentinel_xpath)
+            )
+            return True
+        except TimeoutException:
+            return False
+            
+    def _wait_reloaded(self, old_root, sentinel_xpath, timeout=5):
+        """
+        Wait for the previous document to go away, then for the new one to load
+        
+        Args:
+            old_root (WebElement): Root element of the page being navigated away from
+            sentinel_xpath (str): XPath of an element that marks the new page as usable
+            timeout (float): Maximum seconds to wait for each step
+            
+        Returns:
+            bool: True if the new page loaded before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.staleness_of(old_root))
+        except TimeoutException:
+            return False
+        return self._wait_loaded(sentinel_xpath, timeout)
+        
+    def _scroll_and_wait(self, y, *args, timeout=0.2):
+        """
+        Scroll the window, returning as soon as lazy-loaded content grows the page
+        
+        Args:
+            y (str): JavaScript expression for the vertical scroll position, which
+                can refer to args as arguments[0], arguments[1], ...
+            *args: Values passed to the script, such as WebElements
+            timeout (float): Maximum seconds to wait for the page to grow
+        """
+        height = self.driver.execute_script(
+            f"const height = document.body.scrollHeight; window.scrollTo(0, {y}); return height;", *args
+        )
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: d.execute_script('return document.body.scrollHeight > arguments[0]', height)
+            )
+        except TimeoutException:
+            pass  # Nothing more to load at this position
+            
     def start_browser(self):
         """Start a new browser session with advanced stealth optimizations to avoid detection"""
+        # A DevTools connection to a previous browser is no longer valid
+        if self._cdp:
+            self._cdp.close()
+        self._cdp = None
+        
         # Create browser-specific options based on browser type
         if self.browser_type == 'firefox':
             from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -58,6 +1081,10 @@ class LinkedInScraper:
             else:
                 options = FirefoxOptions()
                 
+                # Return from get() at DOMContentLoaded instead of waiting for every
+                # image and tracker; elements are waited for explicitly
+                options.page_load_strategy = 'eager'
+                
                 # Only use headless mode if explicitly requested
                 if self.headless:
                     options.add_argument('--headless')
@@ -81,8 +1108,7 @@ class LinkedInScraper:
                 firefox_profile.set_preference("geo.enabled", False)
                 
                 # Set a realistic user agent (recent MacOS Firefox)
-                firefox_profile.set_preference("general.useragent.override", 
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/115.0")
+                firefox_profile.set_preference("general.useragent.override", _FIREFOX_UA)
                 
                 # Apply the profile to options
                 options.profile = firefox_profile
@@ -98,15 +1124,8 @@ class LinkedInScraper:
                 # Set window size
                 self.driver.set_window_size(1280, 800)
                 
-                # Use a shorter implicit wait time
-                self.driver.implicitly_wait(3)
-                
-                # Execute JS to modify navigator properties
-                self.driver.execute_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
+                # No implicit wait; elements are waited for explicitly where needed
+                self.driver.implicitly_wait(0)
                 
                 print("Firefox browser started successfully")
             except Exception as e:
@@ -125,6 +1144,10 @@ class LinkedInScraper:
             else:
                 options = Options()
                 
+                # Return from get() at DOMContentLoaded instead of waiting for every
+                # image and tracker; elements are waited for explicitly
+                options.page_load_strategy = 'eager'
+                
                 # Only use headless mode if explicitly requested, as it's easier to detect
                 if self.headless:
                     options.add_argument('--headless=new')  # Use newer headless mode
@@ -132,7 +1155,7 @@ class LinkedInScraper:
                 # CRITICAL: Use user data directory to leverage existing browser profile
                 # This significantly improves loading speed and reduces detection
                 user_home = os.path.expanduser('~')
-                chrome_data_dir = os.path.join(user_home, '.linkedin_chrome_profile')
+                chrome_data_dir = self.user_data_dir or os.path.join(user_home, '.linkedin_chrome_profile')
                 os.makedirs(chrome_data_dir, exist_ok=True)
                 options.add_argument(f'--user-data-dir={chrome_data_dir}')
                 
@@ -153,14 +1176,20 @@ class LinkedInScraper:
                 options.add_argument('--disable-default-apps')
                 
                 # Performance optimizations
-                options.add_argument('--disable-gpu')  # Reduces GPU usage
+                # SwiftShader through ANGLE composites faster than --disable-gpu's
+                # legacy software path and avoids GPU init stalls
+                options.add_argument('--use-gl=angle')
+                options.add_argument('--use-angle=swiftshader-webgl')
+                options.add_argument('--disable-features=' + ','.join(_DISABLED_CHROME_FEATURES))
+                for argument in _CHROME_STARTUP_FLAGS:
+                    options.add_argument(argument)
                 options.add_argument('--dns-prefetch-disable')  # Reduces network fingerprinting
                 
                 # Use a realistic window size instead of maximized (less suspicious)
                 options.add_argument('--window-size=1280,800')
                 
                 # Set a more realistic user agent (recent MacOS Chrome)
-                options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
+                options.add_argument(f'user-agent={_CHROME_UA}')
                 
                 # Enable JavaScript and cookies
                 options.add_experimental_option('prefs', {
@@ -176,56 +1205,82 @@ class LinkedInScraper:
         
         # Create the driver with enhanced error handling
         try:
-            self.driver = webdriver.Chrome(options=options)
+            # Reuse the process-wide chromedriver rather than spawning one per browser
+            service_url = _shared_service_url()
+            if service_url:
+                self.driver = _SharedServiceChrome(
+                    command_executor=ChromiumRemoteConnection(
+                        remote_server_addr=service_url,
+                        vendor_prefix="goog",
+                        browser_name="chrome"
+                    ),
+                    options=options
+                )
+            else:
+                self.driver = webdriver.Chrome(options=options)
             
             # Set page load timeout to prevent hanging
             self.driver.set_page_load_timeout(self.page_load_timeout)
             
-            # Execute CDP commands to avoid detection
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                "platform": "macOS"
-            })
-            
-            # Additional CDP commands to enhance stealth
-            # Disable webdriver flag
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    
-                    // Overwrite the 'plugins' property to use a custom getter
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                    
-                    // Overwrite the 'languages' property to use a custom getter
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['en-US', 'en', 'es']
-                    });
-                    
-                    // Modify the permission state
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                            Promise.resolve({ state: Notification.permission }) :
-                            originalQuery(parameters)
-                    );
-                '''
-            })
+            # Send the startup CDP commands as one batch
+            commands = [
+                # Network is enabled so later header overrides apply to this session
+                ('Network.enable', {}),
+                # Avoid detection with a consistent user agent
+                ('Network.setUserAgentOverride', {
+                    "userAgent": _CHROME_UA,
+                    "platform": "macOS"
+                }),
+                # Install every navigator patch in one script that runs before page code
+                ('Page.addScriptToEvaluateOnNewDocument', {'source': self._STEALTH_JS}),
+            ]
+            if self.block_images:
+                # Drop heavy resources at the network layer; keep the disk cache so
+                # the persistent profile still serves the rest from cache
+                commands += [
+                    ('Network.setBlockedURLs', {'urls': _BLOCKED_URLS}),
+                    ('Network.setCacheDisabled', {'cacheDisabled': False}),
+                ]
+            self._cdp_pipeline(commands)
             
-            # Use a shorter implicit wait time to appear more human-like
-            self.driver.implicitly_wait(3)  # Reduced from 10 seconds
+            # No implicit wait, so each missed find_element fails immediately;
+            # elements are waited for explicitly where needed
+            self.driver.implicitly_wait(0)
         except Exception as e:
             print(f"Error initializing browser: {e}")
             raise
         
     def load_cookies(self):
         """Load cookies from file to maintain LinkedIn session with advanced anti-detection measures"""
-        if not self.cookies_path or not os.path.exists(self.cookies_path):
+        if not self.cookies_path:
             print("No cookies file found. You'll need to create one with save_cookies.py")
             return False
+        
+        # One stat call both checks the file exists and gives its age
+        try:
+            cookie_stat = os.stat(self.cookies_path)
+        except FileNotFoundError:
+            print(f"❌ Cookie file not found at {self.cookies_path}")
+            print(_COOKIE_HELP_TEXT.format(script_dir=os.path.dirname(os.path.abspath(__file__)), cookies_path=self.cookies_path))
+            return False
+        
+        if _check_cookie_age(self.cookies_path, cookie_stat, prompt=self.prompt_refresh):
+            # Reload the browser with new cookies
+            self.driver.quit()
+            self.start_browser()
+            # Start the cookie loading process again from the beginning
+            return self.load_cookies()
+        
+        # Parse and validate the cookie file before any browser work, so a bad
+        # file fails in milliseconds instead of after the homepage has loaded
+        try:
+            cookie_file = _read_cookie_file(self.cookies_path, cookie_stat)
+        except OSError as e:
+            print(f"Error loading cookies: {e}")
+            return False
+        if cookie_file is None:
+            return False
+        data, cookies, cdp_cookies = cookie_file
             
         # Enhanced multi-site navigation pattern to appear more natural
         # Optimized anti-detection pattern (faster, like commercial services)
@@ -236,192 +1291,78 @@ class LinkedInScraper:
         
         # Set a convincing referrer to make it look like we came from a search engine
         # This is more efficient than actually visiting the search engine
-        referrers = [
-            "https://www.google.com/search?q=linkedin+profile", 
-            "https://www.bing.com/search?q=linkedin+login",
-            "https://duckduckgo.com/?q=linkedin"
-        ]
-        
-        # Set a random referrer using CDP (Chrome) or directly (Firefox)
-        if self.browser_type == 'chrome' and hasattr(self.driver, 'execute_cdp_cmd'):
-            # Use CDP to set referrer for Chrome
-            self.driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
-                'headers': {
-                    'Referer': random.choice(referrers)
-                }
-            })
         
         # Go directly to LinkedIn with minimal delay
         print("Going directly to LinkedIn...")
-        self.driver.get("https://www.linkedin.com")
+        if self.browser_type == 'chrome' and hasattr(self.driver, 'execute_cdp_cmd'):
+            # Navigate with a random referrer in one CDP call; it returns once the
+            # navigation commits, so wait only until the document is usable
+            self._cdp_pipeline([('Page.navigate', {
+                'url': "https://www.linkedin.com",
+                'referrer': random.choice(_REFERRERS)
+            })])
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: "linkedin.com" in d.current_url
+                    and d.execute_script('return document.readyState') in ('interactive', 'complete')
+                )
+            except TimeoutException:
+                print("LinkedIn homepage is slow to load, continuing anyway...")
+        else:
+            self.driver.get("https://www.linkedin.com")
         
         # Brief random delay (much shorter than before)
-        time.sleep(random.uniform(0.5, 1.0))  # Just enough delay to seem human-like
+        time.sleep(random.uniform(0.2, 0.4))  # Short jitter so the timing isn't uniform
         
         # Implement optimized human-like behavior simulation (faster, like commercial services)
         try:
-            # Execute minimal but effective anti-detection measures
-            self.driver.execute_script("""
-                // Simplified mouse movement and scrolling - optimized for speed
-                // Just enough to avoid basic bot detection
-                
-                // Simple mouse movement simulation
-                const simpleMouseMovement = () => {
-                    // Create and dispatch a few mouse events at random positions
-                    for (let i = 0; i < 3; i++) {
-                        const x = Math.floor(Math.random() * window.innerWidth);
-                        const y = Math.floor(Math.random() * window.innerHeight);
-                        
-                        const event = new MouseEvent('mousemove', {
-                            'view': window,
-                            'bubbles': true,
-                            'cancelable': true,
-                            'clientX': x,
-                            'clientY': y
-                        });
-                        document.dispatchEvent(event);
-                    }
-                };
-                
-                // Quick scroll simulation
-                const quickScroll = () => {
-                    // Single smooth scroll down
-                    window.scrollBy({
-                        top: 300 + Math.floor(Math.random() * 200),
-                        behavior: 'smooth'
-                    });
-                };
-                
-                // Execute minimal interactions - just enough to avoid detection
-                simpleMouseMovement();
-                quickScroll();
-            """)
-            time.sleep(0.3)  # Minimal delay - just enough for JavaScript to execute
+            # Fire and forget in Chrome so Python doesn't wait on the page;
+            # the smooth scroll keeps animating on its own
+            if self.browser_type == 'chrome' and hasattr(self.driver, 'execute_cdp_cmd'):
+                self._cdp_pipeline([('Runtime.evaluate', {
+                    'expression': self._HUMAN_BEHAVIOR_JS,
+                    'awaitPromise': False,
+                    'returnByValue': False
+                })])
+            else:
+                self.driver.execute_script(self._HUMAN_BEHAVIOR_JS)
         except Exception as e:
             print(f"Human behavior simulation failed, continuing anyway: {e}")
         
         # Clear any existing cookies first - no delay needed
         self.driver.delete_all_cookies()
         
-        # Check if cookie file exists with improved error handling
-        if not os.path.exists(self.cookies_path):
-            print(f"❌ Cookie file not found at {self.cookies_path}")
-            print("\nTo create a new cookies.json file, run one of these commands:")
-            print(f"  python {os.path.join(os.path.dirname(__file__), 'save_cookies.py')} --output {self.cookies_path}")
-            print(f"  python {os.path.join(os.path.dirname(__file__), 'refresh_cookies.py')} --interactive --output {self.cookies_path}")
-            print("\nOr follow these manual steps:")
-            print("1. Open Chrome and log in to LinkedIn")
-            print("2. Use a browser extension like 'EditThisCookie' to export cookies")
-            print("3. Save the cookies to cookies.json")
-            return False
-            
-        # Enhanced cookie validation with more detailed warnings
-        cookie_age = time.time() - os.path.getmtime(self.cookies_path)
-        cookie_age_hours = cookie_age / 3600
-        cookie_age_minutes = cookie_age / 60
-        
-        if cookie_age_hours > 2:
-            print(f"⚠️ WARNING: Cookie file is {cookie_age_hours:.1f} hours old (HIGH RISK)")
-            print("LinkedIn cookies typically expire after 1-2 hours when used for scraping")
-            print("Consider refreshing your cookies before proceeding")
-            refresh_response = input("Would you like to refresh cookies now? (y/n): ").lower()
-            if refresh_response == 'y':
-                try:
-                    # Import refresh_cookies dynamically to avoid circular imports
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location(
-                        "refresh_cookies", 
-                        os.path.join(os.path.dirname(__file__), "refresh_cookies.py")
-                    )
-                    refresh_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(refresh_module)
-                    
-                    # Call the extract_cookies_from_browser function
-                    print("\nLaunching browser to refresh cookies...")
-                    if refresh_module.extract_cookies_from_browser(self.cookies_path, headless=False):
-                        print("Cookies refreshed successfully!")
-                        # Reload the browser with new cookies
-                        self.driver.quit()
-                        self.start_browser()
-                        # Start the cookie loading process again from the beginning
-                        return self.load_cookies()
-                    else:
-                        print("Failed to refresh cookies. Continuing with existing cookies...")
-                except Exception as e:
-                    print(f"Error refreshing cookies: {e}")
-                    print("Continuing with existing cookies...")
-        elif cookie_age_hours > 1:
-            print(f"⚠️ WARNING: Cookie file is {cookie_age_hours:.1f} hours old (MEDIUM RISK)")
-        elif cookie_age_minutes > 30:
-            print(f"ℹ️ Cookie file is {cookie_age_minutes:.1f} minutes old (LOW RISK)")
-        else:
-            print(f"✅ Cookie file is fresh ({cookie_age_minutes:.1f} minutes old)")
-            
-        # Load cookies from file with improved error handling and validation
+        # Apply the validated cookies with improved error handling
         try:
-            with open(self.cookies_path, 'r') as f:
+            # Set user agent from saved session if available
+            if isinstance(data, dict) and 'user_agent' in data:
                 try:
-                    data = json.load(f)
-                    
-                    # Check if this is the new enhanced session format or old format
-                    if isinstance(data, dict) and 'cookies' in data and 'version' in data:
-                        print(f"Detected enhanced session data format v{data['version']}")
-                        cookies = data['cookies']
-                        
-                        # Extract session creation time if available
-                        if 'created_at' in data:
-                            print(f"Session created: {data['created_at']}")
-                            
-                        # Set user agent from saved session if available
-                        if 'user_agent' in data:
-                            try:
-                                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                                    "userAgent": data['user_agent']
-                                })
-                                print("Applied session-specific user agent")
-                            except Exception as e:
-                                print(f"Could not set user agent: {e}")
-                    else:
-                        # Legacy format - just a list of cookies
-                        cookies = data
-                        print("Using legacy cookie format")
-                except json.JSONDecodeError as e:
-                    print(f"❌ Error: Cookie file is not valid JSON: {e}")
-                    print("Please recreate your cookies file using save_cookies.py")
-                    return False
-                
-            if not cookies or not isinstance(cookies, list):
-                print("❌ Error: Cookie file has invalid format (empty or not a list)")
-                print("Please recreate your cookies file using save_cookies.py")
-                return False
-                
-            # Validate critical LinkedIn cookies are present
-            critical_cookies = ['li_at', 'JSESSIONID']
-            found_critical = [c for c in critical_cookies if any(cookie.get('name') == c for cookie in cookies)]
-            
-            if not found_critical:
-                print("❌ Error: No critical LinkedIn authentication cookies found")
-                print("Please recreate your cookies file using save_cookies.py")
-                return False
-            elif len(found_critical) < len(critical_cookies):
-                missing = set(critical_cookies) - set(found_critical)
-                print(f"⚠️ Warning: Missing some important cookies: {', '.join(missing)}")
-                print("Authentication may fail or have limited functionality")
+                    self._cdp_pipeline([('Network.setUserAgentOverride', {
+                        "userAgent": data['user_agent']
+                    })])
+                    print("Applied session-specific user agent")
+                except Exception as e:
+                    print(f"Could not set user agent: {e}")
                 
-            # Add cookies to browser with improved error handling
+            # Chrome takes every cookie in a single CDP call
             cookie_count = 0
-            for cookie in cookies:
-                # Some cookies can cause issues, so try each one separately
+            if self.browser_type == 'chrome' and hasattr(self.driver, 'execute_cdp_cmd'):
                 try:
-                    # Ensure domain is set correctly for LinkedIn cookies
-                    if 'domain' not in cookie or not cookie['domain']:
-                        cookie['domain'] = '.linkedin.com'
-                    self.driver.add_cookie(cookie)
-                    cookie_count += 1
+                    self._cdp_pipeline([('Network.setCookies', {'cookies': cdp_cookies})])
+                    cookie_count = len(cookies)
                 except Exception as e:
-                    # Only print errors for important cookies
-                    if cookie.get('name') in critical_cookies:
-                        print(f"Error adding critical cookie {cookie.get('name')}: {e}")
+                    print(f"Batch cookie load failed, adding cookies one at a time: {e}")
+            
+            if not cookie_count:
+                for cookie in cookies:
+                    # Some cookies can cause issues, so try each one separately
+                    try:
+                        self.driver.add_cookie(cookie)
+                        cookie_count += 1
+                    except Exception as e:
+                        # Only print errors for important cookies
+                        if cookie.get('name') in _CRITICAL_COOKIES:
+                            print(f"Error adding critical cookie {cookie.get('name')}: {e}")
                     
             print(f"✅ Added {cookie_count} cookies from {self.cookies_path}")
                     
@@ -453,56 +1394,53 @@ class LinkedInScraper:
                 except Exception as e:
                     print(f"Warning: Could not restore browser storage: {e}")
             
-            # Refresh page to apply cookies with random delay to appear more human-like
+            # Refresh page to apply cookies, then wait only until the logged-in
+            # navigation or the feed shows up
             print("Refreshing page to apply cookies...")
             self.driver.refresh()
-            time.sleep(random.uniform(2.0, 3.0))  # Slightly reduced wait time
+            try:
+                WebDriverWait(self.driver, 8).until(
+                    lambda d: 'feed' in d.current_url or d.find_elements(By.CSS_SELECTOR, _LOGGED_IN_SELECTOR)
+                )
+            except TimeoutException:
+                pass  # The checks below decide whether the session works
             
             # Advanced multi-factor authentication verification
             # This uses multiple strategies to determine if we're properly logged in
             print("Verifying authentication status...")
             
-            # Strategy 1: Check for login/signup indicators (negative signals)
-            login_indicators = [
-                "Sign in", "Join now", "Sign in with Google", "New to LinkedIn?", 
-                "Join LinkedIn", "Email or phone", "Forgot password", "Sign in to LinkedIn"
-            ]
-            
-            # Strategy 2: Check for member indicators (positive signals)
-            member_indicators = [
-                "feed-identity-module", "identity-headline", "identity-name", "profile-rail",
-                "global-nav-me", "mynetwork", "messaging", "notifications", "premium-upsell-button",
-                "groups-entity", "jobs-home", "feed-tab-icon", "nav-settings__dropdown"
-            ]
-            
-            # Strategy 3: Check for premium indicators (strong positive signals)
-            premium_indicators = [
-                "premium-upsell", "premium-badge", "premium-icon", "sales-nav", "recruiter-nav"
-            ]
-            
-            # Get page source and URL for analysis
-            page_text = self.driver.page_source.lower()
             current_url = self.driver.current_url.lower()
             
-            # Perform multi-strategy authentication check
-            login_detected = any(indicator.lower() in page_text for indicator in login_indicators)
-            member_detected = any(indicator.lower() in page_text for indicator in member_indicators)
-            premium_detected = any(indicator.lower() in page_text for indicator in premium_indicators)
-            feed_url_detected = "feed" in current_url or "mynetwork" in current_url
-            
-            # Calculate authentication confidence score (0-100)
-            auth_score = 0
-            if not login_detected: auth_score += 30  # No login indicators is good
-            if member_detected: auth_score += 40    # Member indicators are strong positive
-            if premium_detected: auth_score += 10    # Premium indicators are bonus
-            if feed_url_detected: auth_score += 20   # Being on feed/network pages is good
-            
-            # Log authentication details for debugging
-            print(f"Authentication confidence score: {auth_score}/100")
-            print(f"- Login indicators detected: {login_detected}")
-            print(f"- Member indicators detected: {member_detected}")
-            print(f"- Premium indicators detected: {premium_detected}")
-            print(f"- Feed/network URL detected: {feed_url_detected}")
+            # A members-only page path already proves the session works, so the
+            # page source (often megabytes over the wire) is only fetched when
+            # the URL is ambiguous. The query string is ignored because login
+            # redirects carry the original URL there.
+            if urlsplit(current_url).path.startswith(_MEMBER_URL_PREFIXES):
+                auth_score = 90
+                print(f"Authentication confidence score: {auth_score}/100")
+                print("- Members-only URL detected, skipping page analysis")
+            else:
+                # Check login indicators (negative), member indicators (positive) and
+                # premium indicators (strong positive) in a single scan of the page
+                indicators_found = _scan_auth_indicators(self.driver.page_source)
+                login_detected = 'login' in indicators_found
+                member_detected = 'member' in indicators_found
+                premium_detected = 'premium' in indicators_found
+                feed_url_detected = "feed" in current_url or "mynetwork" in current_url
+                
+                # Calculate authentication confidence score (0-100)
+                auth_score = 0
+                if not login_detected: auth_score += 30  # No login indicators is good
+                if member_detected: auth_score += 40    # Member indicators are strong positive
+                if premium_detected: auth_score += 10    # Premium indicators are bonus
+                if feed_url_detected: auth_score += 20   # Being on feed/network pages is good
+                
+                # Log authentication details for debugging
+                print(f"Authentication confidence score: {auth_score}/100")
+                print(f"- Login indicators detected: {login_detected}")
+                print(f"- Member indicators detected: {member_detected}")
+                print(f"- Premium indicators detected: {premium_detected}")
+                print(f"- Feed/network URL detected: {feed_url_detected}")
             
             # Decision logic based on authentication score
             if auth_score >= 70:
@@ -518,11 +1456,12 @@ class LinkedInScraper:
                 
                 # Save screenshot for debugging with timestamp
                 try:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_dir = os.path.join(os.path.dirname(self.cookies_path), "debug_screenshots")
-                    os.makedirs(screenshot_dir, exist_ok=True)
-                    screenshot_path = os.path.join(screenshot_dir, f"login_screen_{timestamp}.png")
-                    self.driver.save_screenshot(screenshot_path)
+                    screenshot_dir = self._artifact_dir / "debug_screenshots"
+                    if not self._screenshot_dir_ready:
+                        os.makedirs(screenshot_dir, exist_ok=True)
+                        self._screenshot_dir_ready = True
+                    screenshot_path = screenshot_dir / f"login_screen_{time.time_ns()}.png"
+                    self.driver.save_screenshot(str(screenshot_path))
                     print(f"Saved login screen screenshot to {screenshot_path}")
                 except Exception as e:
                     print(f"Failed to save screenshot: {e}")
@@ -531,12 +1470,16 @@ class LinkedInScraper:
                 try:
                     print("Attempting to navigate to LinkedIn homepage as a last resort...")
                     self.driver.get("https://www.linkedin.com/")
-                    time.sleep(3)
                     
                     # Quick re-check for authentication
-                    if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
+                    try:
+                        WebDriverWait(self.driver, 5).until(
+                            lambda d: "feed" in d.current_url or "mynetwork" in d.current_url
+                        )
                         print("✅ Successfully authenticated after homepage redirect!")
                         return True
+                    except TimeoutException:
+                        pass
                 except Exception as e:
                     print(f"Homepage navigation failed: {e}")
                     
@@ -549,124 +1492,378 @@ class LinkedInScraper:
             
         return True
         
-    def scrape_profile(self, profile_url, timeout=20, debug=False):
+    def _http_client(self):
+        """Return the HTTP client for this browser session, creating it on first use
+        
+        The session cookies are copied from the browser once, and the client's
+        connection to LinkedIn is kept open for every later profile.
+        
+        Returns:
+            httpx.Client: Client sending the browser's LinkedIn session cookies
+        """
+        if self._http is None:
+            cookies = httpx.Cookies()
+            for cookie in self.driver.get_cookies():
+                if cookie.get('name') in _HTTP_SESSION_COOKIES:
+                    cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', '.linkedin.com'))
+            self._http = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                cookies=cookies,
+                headers={
+                    'user-agent': _CHROME_UA,
+                    'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'accept-language': 'en-US,en;q=0.9',
+                },
+                follow_redirects=True,
+                timeout=self.page_load_timeout
+            )
+        return self._http
+        
+    def fetch_profile_html(self, profile_url):
+        """Fetch a profile page over HTTP using the browser's session cookies
+        
+        Args:
+            profile_url (str): URL of the LinkedIn profile
+            
+        Returns:
+            str: Page HTML, or None if LinkedIn answered with a login or challenge page
+        """
+        response = self._http_client().get(profile_url)
+        
+        final_url = str(response.url)
+        if response.status_code != 200 or any(fragment in final_url for fragment in _CHALLENGE_URL_FRAGMENTS):
+            return None
+        return response.text
+        
+    def _scrape_profile_http(self, profile_url):
+        """Try to scrape a profile without rendering it in the browser
+        
+        Returns:
+            dict: Profile information, or None if the browser is needed
+        """
+        try:
+            html = self.fetch_profile_html(profile_url)
+        except Exception as e:
+            print(f"HTTP profile fetch failed, falling back to the browser: {e}")
+            return None
+        if html is None:
+            print("LinkedIn returned a login or challenge page over HTTP, falling back to the browser")
+            return None
+        
+        profile_data = _parse_profile_html(html)
+        # Most profile content is rendered client-side, so only trust the HTTP
+        # result when it contains more than the top card
+        if not profile_data or not (profile_data["experience"] or profile_data["education"]):
+            print("Profile HTML was incomplete, falling back to the browser")
+            return None
+        return profile_data
+        
+    def _page_contains(self, texts, ignore_case=False):
+        """
+        Search the page HTML for each text inside the browser
+        
+        Only the answers come back, instead of the whole page source, which is
+        often megabytes.
+        
+        Args:
+            texts (list): Strings to look for, lowercase if ignore_case is set
+            ignore_case (bool): Whether to lowercase the HTML before searching
+            
+        Returns:
+            list: One bool per text, True if the page contains it
+        """
+        return self.driver.execute_script("""
+            let html = document.documentElement.outerHTML;
+            if (arguments[1]) {
+                html = html.toLowerCase();
+            }
+            return arguments[0].map((text) => html.includes(text));
+        """, list(texts), ignore_case)
+        
+    def _by_hits(self, selectors):
+        """
+        Order selectors so the ones that matched most often on earlier profiles come first
+        
+        Args:
+            selectors (tuple): XPaths in their default order, which breaks ties
+            
+        Returns:
+            list: The same XPaths, most successful first
+        """
+        hits = self._selector_hits
+        return sorted(selectors, key=lambda selector: -hits[selector])
+        
+    def _find_any(self, xpaths, timeout=3):
+        """
+        Wait for the first of several XPaths to match, polling them all at once
+        
+        A missing section costs one timeout instead of one per selector.
+        
+        Args:
+            xpaths (tuple): XPaths to try, in order of preference
+            timeout (float): Maximum time in seconds to wait for any of them
+            
+        Returns:
+            tuple: (element, selector) for the first match, or (None, None)
+        """
+        found = self.driver.execute_async_script(self._FIND_ANY_JS, self._by_hits(xpaths), int(timeout * 1000))
+        if not found:
+            return None, None
+        element, selector = found
+        self._selector_hits[selector] += 1
+        return element, selector
+        
+    def _result_key(self, profile_url):
+        """Key a scraped profile on its URL and the cookie file it was scraped with"""
+        try:
+            cookie_stat = os.stat(self.cookies_path)
+            cookie_state = f"{os.path.abspath(self.cookies_path)}:{cookie_stat.st_mtime_ns}:{cookie_stat.st_size}"
+        except (TypeError, OSError):
+            cookie_state = ""
+        return f"{profile_url.rstrip('/')}|{cookie_state}"
+        
+    def _load_saved_results(self):
+        """Merge cache.json from the artifact directory into the shared results, once per file
+        
+        Must be called with _result_cache_lock held.
+        """
+        path = os.path.abspath(self._artifact_dir / "cache.json")
+        if path in _result_cache_files:
+            return
+        _result_cache_files.add(path)
+        try:
+            with open(path, 'rb') as f:
+                saved = _loads(f.read())
+            for key, (scraped_at, profile_data) in saved.items():
+                if key not in _result_cache or _result_cache[key][0] < scraped_at:
+                    _result_cache[key] = (scraped_at, profile_data)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"Ignoring unreadable profile cache: {e}")
+        
+    def _cached_result(self, key):
+        """Return a copy of a profile scraped less than result_ttl seconds ago, or None
+        
+        Results are shared by every scraper in the process, so a new scraper or
+        another browser in a pool reuses them too.
+        
+        Args:
+            key (str): Key from _result_key
+            
+        Returns:
+            dict: Previously extracted profile information, or None
+        """
+        with _result_cache_lock:
+            if self.persist_results:
+                self._load_saved_results()
+            entry = _result_cache.get(key)
+        if entry and time.time() - entry[0] < self.result_ttl:
+            return copy.deepcopy(entry[1])
+        return None
+        
+    def _store_result(self, key, profile_data):
+        """Remember a successfully scraped profile for _cached_result
+        
+        Args:
+            key (str): Key from _result_key
+            profile_data (dict): Extracted profile information
+        """
+        now = time.time()
+        with _result_cache_lock:
+            _result_cache[key] = (now, copy.deepcopy(profile_data))
+            
+            # Drop expired profiles so the cache doesn't grow without bound
+            expired = [k for k, (scraped_at, _) in _result_cache.items() if now - scraped_at >= self.result_ttl]
+            for k in expired:
+                del _result_cache[k]
+            
+            if self.persist_results:
+                self._load_saved_results()
+                # Write to a temporary file and move it into place, so another
+                # process never reads a half-written cache
+                path = self._artifact_dir / "cache.json"
+                temp_path = path.with_name(f"cache.json.{os.getpid()}.tmp")
+                try:
+                    temp_path.write_bytes(_dumps(_result_cache))
+                    os.replace(temp_path, path)
+                except OSError as e:
+                    print(f"Failed to save profile cache: {e}")
+        
+    def _async_screenshot(self, path):
+        """
+        Capture a screenshot and write it to disk on a background thread
+        
+        Only the capture waits on the browser; the file write overlaps with
+        whatever scraping happens next.
+        
+        Args:
+            path (Path): File to write the PNG to
+        """
+        png = self.driver.get_screenshot_as_png()
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._io_pool.submit(path.write_bytes, png)
+        print(f"Saving screenshot to {path}")
+        
+    def _retry_get(self, url, max_retries=3):
+        """
+        Navigate to a URL, retrying only the errors a retry can fix
+        
+        Args:
+            url (str): URL to open
+            max_retries (int): Maximum number of attempts
+            
+        Returns:
+            bool: True if a navigation attempt succeeded
+            
+        Raises:
+            WebDriverException: If the navigation fails for a reason that won't
+                go away on a retry, such as an invalid URL
+        """
+        for attempt in range(1, max_retries + 1):
+            try:
+                self.driver.get(url)
+                print(f"Successfully navigated to profile on attempt {attempt}")
+                return True
+            except WebDriverException as e:
+                message = str(e)
+                if not isinstance(e, TimeoutException) and not any(error in message for error in _TRANSIENT_NAVIGATION_ERRORS):
+                    raise
+                print(f"Navigation attempt {attempt} failed: {message}")
+                if attempt < max_retries:
+                    # Exponential backoff with jitter, so the browsers in a pool
+                    # don't all retry at the same moment
+                    delay = min(8, 2 ** attempt) + random.uniform(0, 0.5)
+                    print(f"Retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
+        print("Max retries reached. Continuing with best effort...")
+        return False
+        
+    def _check_homepage_auth(self):
+        """
+        Visit the LinkedIn homepage and make sure it doesn't ask for a login
+        
+        Returns:
+            bool: True if the homepage showed a logged-in session
+        """
+        # Simplified authentication check with faster timing
+        print("Visiting LinkedIn homepage...")
+        try:
+            self.driver.get("https://www.linkedin.com/")
+            self._wait_loaded('//*[@id="global-nav"] | //main', 5)
+        except TimeoutException:
+            print("LinkedIn homepage timed out, proceeding anyway...")
+            
+        # Quick authentication check
+        sign_in, join_now = self._page_contains(["Sign in", "Join now"])
+        if not sign_in and not join_now:
+            return True
+            
+        print("Warning: Not properly authenticated on LinkedIn homepage")
+        # Try refreshing cookies by visiting the login page again
+        try:
+            self.driver.get("https://www.linkedin.com/login")
+            self._wait_loaded('//*[@id="global-nav"] | //form', 3)
+            # Check if authentication worked
+            if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
+                print("Successfully authenticated after visiting login page")
+                return True
+        except Exception as e:
+            print(f"Error during authentication refresh: {e}")
+        return False
+        
+    def scrape_profile(self, profile_url, timeout=20, debug=False, warm=False):
         """Scrape a LinkedIn profile and extract relevant information
         
         Args:
             profile_url (str): URL of the LinkedIn profile to scrape
             timeout (int): Maximum time in seconds to spend scraping a profile (reduced from 120s to 30s)
             debug (bool): Whether to enable additional debug output and screenshots
+            warm (bool): Whether this session already scraped a profile, so the
+                homepage check is skipped and the profile is opened directly
             
         Returns:
             dict: Extracted profile information
         """
-        if not self.driver:
-            self.start_browser()
-            if not self.load_cookies():
-                return {"error": "Authentication failed"}
+        # Profiles scraped recently with the same cookies are returned as-is
+        cache_key = self._result_key(profile_url)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            print(f"Reusing profile scraped less than {self.result_ttl // 60} minutes ago: {profile_url}")
+            return cached
+            
+        if not self.ensure_session():
+            return {"error": "Authentication failed"}
+            
+        # Fetching the HTML directly is much cheaper than rendering the page
+        if HTTP_SCRAPING_AVAILABLE and self.use_http:
+            profile_data = self._scrape_profile_http(profile_url)
+            if profile_data:
+                print("Extracted profile over HTTP")
+                self._store_result(cache_key, profile_data)
+                return profile_data
                 
         # Set a timeout to prevent scraping from taking too long - reduced from 120s to 30s
         start_time = time.time()
+        # Nothing extracted yet, in case navigation fails before extraction starts
+        profile_data = None
         
         try:
-            # Simplified authentication check with faster timing
-            print("Visiting LinkedIn homepage...")
-            try:
-                self.driver.get("https://www.linkedin.com/")
-                time.sleep(1)  # Reduced wait time even further
-            except TimeoutException:
-                print("LinkedIn homepage timed out, proceeding anyway...")
-                
-            # Quick authentication check
-            if "Sign in" in self.driver.page_source or "Join now" in self.driver.page_source:
-                print("Warning: Not properly authenticated on LinkedIn homepage")
-                # Try refreshing cookies by visiting the login page again
-                try:
-                    self.driver.get("https://www.linkedin.com/login")
-                    time.sleep(1)  # Reduced wait time
-                    # Check if authentication worked
-                    if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
-                        print("Successfully authenticated after visiting login page")
-                except Exception as e:
-                    print(f"Error during authentication refresh: {e}")
+            # The homepage check costs a couple of seconds, so it only runs
+            # until it has passed once for this browser session, and never
+            # for the later profiles of a batch
+            if not warm and not self._homepage_checked:
+                self._homepage_checked = self._check_homepage_auth()
             
             # Navigate to the profile with a more human-like approach and retry mechanism
             print(f"Navigating to {profile_url}")
             self.driver.set_page_load_timeout(15)  # Reasonable timeout
             
-            # Implement retry mechanism for profile navigation
-            max_retries = 3
-            retry_count = 0
-            navigation_successful = False
-            
-            while retry_count < max_retries and not navigation_successful:
-                try:
-                    # Direct navigation to profile URL
-                    self.driver.get(profile_url)
-                    navigation_successful = True
-                    print(f"Successfully navigated to profile on attempt {retry_count + 1}")
-                except Exception as e:
-                    retry_count += 1
-                    print(f"Navigation attempt {retry_count} failed: {e}")
-                    if retry_count < max_retries:
-                        print(f"Retrying in {retry_count * 2} seconds...")
-                        time.sleep(retry_count * 2)  # Exponential backoff
-                        # Try refreshing the browser state
-                        try:
-                            self.driver.get("https://www.linkedin.com")
-                            time.sleep(1)
-                        except:
-                            pass
-                    else:
-                        print("Max retries reached. Continuing with best effort...")
+            # Direct navigation to profile URL, retrying only transient failures
+            navigation_successful = self._retry_get(profile_url)
             
             # If all navigation attempts failed, try one last approach
             if not navigation_successful:
                 try:
                     print("Attempting alternative navigation method...")
                     # Try using JavaScript for navigation as a last resort
-                    self.driver.execute_script(f"window.location.href = '{profile_url}';")
-                    time.sleep(3)  # Wait for JS navigation
+                    old_root = self.driver.find_element(By.TAG_NAME, 'html')
+                    self.driver.execute_script("window.location.href = arguments[0];", profile_url)
+                    self._wait_reloaded(old_root, '//h1', 5)
                 except Exception as e:
                     print(f"Alternative navigation also failed: {e}")
             
-            # Minimal delay - just enough to let the page start loading
-            time.sleep(0.3)
+            # Wait for the profile heading rather than a fixed delay
+            self._wait_loaded('//h1', 5)
             
             # Only take screenshot in debug mode to save time
             if debug:
                 try:
-                    pre_scroll_screenshot = os.path.join(os.path.dirname(self.cookies_path), "pre_scroll.png")
-                    self.driver.save_screenshot(pre_scroll_screenshot)
-                    print(f"Saved pre-scroll screenshot to {pre_scroll_screenshot}")
+                    self._async_screenshot(self._artifact_dir / "pre_scroll.png")
                 except Exception as e:
                     print(f"Failed to save pre-scroll screenshot: {e}")
             
-            # Optimized scrolling - much faster but still effective
-            print("Fast scrolling to load content...")
+            # One in-browser pass scrolls down a screen at a time until lazy
+            # loading stops growing the page, then returns to the top
+            print("Scrolling to load profile content...")
             try:
-                # Single efficient scroll command to load most of the content at once
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.7);")
-                time.sleep(0.2)
-                
-                # One more scroll to reach the bottom in a single efficient movement
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(0.2)  # Brief pause to let content load
+                self.driver.execute_async_script(self._SCROLL_JS)
             except Exception as e:
                 print(f"Error during scrolling: {e}")
                 
                 # Simple login wall check
-                if "Sign in" in self.driver.page_source and "Join now" in self.driver.page_source:
+                if all(self._page_contains(["Sign in", "Join now"])):
                     print("Login wall detected - authentication failed")
-                    try:
-                        screenshot_path = os.path.join(os.path.dirname(self.cookies_path), "login_wall.png")
-                        self.driver.save_screenshot(screenshot_path)
-                    except Exception as e:
-                        print(f"Failed to save screenshot: {e}")
+                    if debug:
+                        try:
+                            self._async_screenshot(self._artifact_dir / "login_wall.png")
+                        except Exception as e:
+                            print(f"Failed to save screenshot: {e}")
                     return {"error": "Login required to view this profile"}
                     
                 # Simple page not found check
-                if "this page doesn't exist" in self.driver.page_source.lower():
+                if self._page_contains(["this page doesn't exist"], ignore_case=True)[0]:
                     print("Error: LinkedIn says 'This page doesn't exist'")
                     return {"error": "Profile not found - page doesn't exist"}
                 
@@ -674,8 +1871,9 @@ class LinkedInScraper:
                 print("Profile page load timed out, but continuing anyway...")
                 # Quick refresh attempt
                 try:
+                    old_root = self.driver.find_element(By.TAG_NAME, 'html')
                     self.driver.refresh()
-                    time.sleep(3)  # Brief wait after refresh
+                    self._wait_reloaded(old_root, '//h1', 3)
                 except Exception as e:
                     print(f"Error during page refresh: {e}")
             
@@ -689,23 +1887,6 @@ class LinkedInScraper:
                 "interests": []
             }
             
-            # Fast, minimal scrolling to trigger lazy loading
-            print("Quick scrolling to load profile content...")
-            try:
-                # Single scroll to trigger lazy loading
-                self.driver.execute_script("window.scrollTo(0, 300);")
-                time.sleep(0.2)
-                
-                # Quick scroll to bottom to ensure all content loads
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(0.3)
-                
-                # Back to top for extraction
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(0.2)
-            except Exception as e:
-                print(f"Error during scrolling: {e}, continuing anyway")
-            
             print("Starting profile extraction...")
             
             # Extract basic info with improved selectors and error handling
@@ -714,134 +1895,48 @@ class LinkedInScraper:
             # Elements should already be visible from our previous scroll to top
             # No need for additional scrolling or waiting here
             
+            basic_info = {}
             try:
                 
-                # Name extraction with updated selectors for 2025 LinkedIn
-                name_selectors = [
-                    '//h1[contains(@class, "text-heading-xlarge")]',
-                    '//h1[contains(@class, "ember-view")]',
-                    '//h1',
-                    '//div[contains(@class, "pv-text-details__left-panel")]/div[1]',
-                    '//div[contains(@class, "display-flex")]/h1',
-                    '//div[contains(@class, "profile-info")]/h1',
-                    '//div[contains(@class, "profile-header")]//h1',
-                    '//*[contains(@class, "profile-info")]//*[contains(@class, "name")]'
-                ]
-                
-                # Take an initial screenshot immediately after page load
-                try:
-                    initial_screenshot_path = os.path.join(os.path.dirname(self.cookies_path), "profile_initial.png")
-                    self.driver.save_screenshot(initial_screenshot_path)
-                    print(f"Saved initial screenshot to {initial_screenshot_path}")
-                except Exception as e:
-                    print(f"Failed to save initial screenshot: {e}")
-                    
-                # Perform faster scrolling to ensure content is loaded
-                print("Performing quick scrolling to trigger content loading...")
-                try:
-                    # Faster scrolling with shorter pauses
-                    for scroll_position in [300, 600, 900, 1200, 600, 300]:
-                        self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                        time.sleep(0.2)  # Shorter pause
-                    
-                    # Take screenshot after scrolling
-                    screenshot_path = os.path.join(os.path.dirname(self.cookies_path), "profile_screenshot.png")
-                    self.driver.save_screenshot(screenshot_path)
-                    print(f"Saved profile screenshot to {screenshot_path}")
-                except Exception as e:
-                    print(f"Failed to save screenshot: {e}")
-                
-                for selector in name_selectors:
+                # Take screenshot after scrolling, only in debug mode
+                if debug:
                     try:
-                        name = self.driver.find_element(By.XPATH, selector).text
-                        if name and len(name.strip()) > 1:
-                            profile_data["basic_info"]["name"] = name.strip()
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-                        
-                if "name" not in profile_data["basic_info"] or not profile_data["basic_info"]["name"]:
-                    profile_data["basic_info"]["name"] = "Not found"
-                
-                # Headline extraction with updated selectors for 2025 LinkedIn
-                headline_selectors = [
-                    '//div[contains(@class, "text-body-medium") and not(contains(@class, "visually-hidden"))]',
-                    '//div[contains(@class, "pv-text-details__left-panel")]/div[2]',
-                    '//div[contains(@class, "ph5")]/div[2]',
-                    '//div[contains(@class, "display-flex")]/div[contains(@class, "text-body")]',
-                    '//div[contains(@class, "profile-info")]/div[contains(@class, "headline")]',
-                    '//*[contains(@class, "profile-info")]//*[contains(@class, "headline")]',
-                    '//*[contains(@class, "pv-top-card")]//*[contains(@class, "text-body-medium")]',
-                    '//div[@aria-label="Profile information"]/div[2]',
-                    '//div[contains(@class, "profile-header")]/div[2]'
-                ]
+                        self._async_screenshot(self._artifact_dir / "profile_screenshot.png")
+                    except Exception as e:
+                        print(f"Failed to save screenshot: {e}")
                 
-                # Print page source for debugging
-                print("Analyzing page structure...")
-                page_text = self.driver.page_source.lower()
-                if "headline" in page_text:
-                    print("Page contains 'headline' text")
-                if "experience" in page_text:
-                    print("Page contains 'experience' text")
-                if "education" in page_text:
-                    print("Page contains 'education' text")
+                # Pages return at DOMContentLoaded, so wait for the profile content itself
+                try:
+                    WebDriverWait(self.driver, self.element_timeout).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '#main, section.pv-top-card, h1'))
+                    )
+                except TimeoutException:
+                    pass
                 
-                for selector in headline_selectors:
-                    try:
-                        headline = self.driver.find_element(By.XPATH, selector).text
-                        if headline and len(headline.strip()) > 1:
-                            profile_data["basic_info"]["headline"] = headline.strip()
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-                        
-                if "headline" not in profile_data["basic_info"] or not profile_data["basic_info"]["headline"]:
-                    profile_data["basic_info"]["headline"] = "Not found"
+                # Print page structure in debug mode only, it doesn't feed the extraction
+                if debug:
+                    print("Analyzing page structure...")
+                    sections = ["headline", "experience", "education"]
+                    for section, present in zip(sections, self._page_contains(sections, ignore_case=True)):
+                        if present:
+                            print(f"Page contains '{section}' text")
                 
-                # Location extraction with multiple selectors
-                location_selectors = [
-                    '//span[contains(@class, "text-body-small")][contains(@class, "inline")]',
-                    '//div[contains(@class, "pv-text-details__left-panel")]/span[1]',
-                    '//div[contains(@class, "pb2")]/span[1]',
-                    '//span[contains(@class, "text-body-small") and contains(text(), "Austin")]'
-                ]
+                # Resolve every field in one script call instead of a WebDriver
+                # round trip per selector
+                basic_info = _loads(self.driver.execute_script(
+                    self._BASIC_INFO_JS, self._by_hits(_NAME_XPATHS), self._by_hits(_HEADLINE_XPATHS),
+                    self._by_hits(_LOCATION_XPATHS), self._by_hits(_ABOUT_XPATHS)
+                ))
+                self._selector_hits.update(basic_info.get("matched", ()))
                 
-                for selector in location_selectors:
-                    try:
-                        location = self.driver.find_element(By.XPATH, selector).text
-                        if location and len(location.strip()) > 1:
-                            profile_data["basic_info"]["location"] = location.strip()
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-                        
-                if "location" not in profile_data["basic_info"] or not profile_data["basic_info"]["location"]:
-                    profile_data["basic_info"]["location"] = "Not found"
+                for field in ("name", "headline", "location"):
+                    profile_data["basic_info"][field] = basic_info.get(field) or "Not found"
             except Exception as e:
                 print(f"Error extracting basic info: {e}")
                 
-            # Extract About section with improved selectors
+            # The About text was read along with the basic info
             print("Extracting about section...")
-            try:
-                # Try multiple selectors for the About section
-                about_selectors = [
-                    '//div[contains(@class, "display-flex")][./span[text()="About"]]/following-sibling::div',
-                    '//section[.//span[text()="About"]]//div[contains(@class, "display-flex")]/span[1]',
-                    '//section[contains(@class, "summary")]//p',
-                    '//div[contains(@class, "inline-show-more-text")]'
-                ]
-                
-                for selector in about_selectors:
-                    try:
-                        about_section = self.driver.find_element(By.XPATH, selector)
-                        about_text = about_section.text.strip()
-                        if about_text and len(about_text) > 5:
-                            profile_data["about"] = about_text
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-            except Exception:
-                profile_data["about"] = ""
+            profile_data["about"] = basic_info.get("about", "")
             
             # Check if we've exceeded the timeout
             elapsed_time = time.time() - start_time
@@ -856,103 +1951,37 @@ class LinkedInScraper:
                 # Add a small random delay before extraction to appear more human-like
                 time.sleep(random.uniform(0.5, 1.2))
                 
-                # Try multiple selectors for experience section with better error handling
-                experience_selectors = [
-                    '//section[.//span[text()="Experience"]]',
-                    '//section[contains(@class, "experience")]',
-                    '//div[contains(@id, "experience")]',
-                    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Experience")]]'
-                ]
-                
-                experience_section = None
-                for selector in experience_selectors:
-                    try:
-                        # Use a slightly longer wait time for better reliability
-                        experience_section = WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        if experience_section:
-                            print(f"Found experience section with selector: {selector}")
-                            break
-                    except (NoSuchElementException, TimeoutException):
-                        continue
+                experience_section, selector = self._find_any(_EXPERIENCE_SECTION_XPATHS, 3)
+                if experience_section:
+                    print(f"Found experience section with selector: {selector}")
                 
                 if experience_section:
-                    # Try multiple selectors for experience items
-                    item_selectors = [
-                        './/ul/li',
-                        './/div[contains(@class, "pvs-entity")]',
-                        './/div[contains(@class, "display-flex")][.//*[contains(@class, "t-bold")]]'
-                    ]
-                    
-                    experience_items = []
-                    for selector in item_selectors:
-                        items = experience_section.find_elements(By.XPATH, selector)
-                        if items:
-                            print(f"Found {len(items)} experience items with selector: {selector}")
-                            experience_items = items[:3]  # Get up to 3 most recent experiences
-                            break
+                    # Read the text of up to 3 of the most recent experiences in one
+                    # script call; the usual layout is classified from the lines alone
+                    found = _loads(self.driver.execute_script(
+                        self._SECTION_ITEMS_JS, experience_section, self._by_hits(_SECTION_ITEM_XPATHS), {}, 3
+                    ))
+                    parsed = [_classify_experience_lines(row["lines"]) for row in found["items"]]
+                    if found["items"]:
+                        print(f"Found {found['total']} experience items with selector: {found['selector']}")
+                        self._selector_hits[found["selector"]] += 1
+                        
+                        # Only fall back to the per-field XPaths when some item's
+                        # lines didn't fit the layout
+                        if not all(parsed):
+                            found = _loads(self.driver.execute_script(
+                                self._SECTION_ITEMS_JS, experience_section, [found["selector"]],
+                                {"title": _EXPERIENCE_TITLE_XPATHS, "company": _EXPERIENCE_COMPANY_XPATHS, "duration": _EXPERIENCE_DURATION_XPATHS}, 3
+                            ))
                     
                     # Process experience items with improved text extraction
-                    for item in experience_items:
-                        experience = {}
-                        
-                        # Try to extract structured data first
-                        try:
-                            # Title - try multiple selectors
-                            title_selectors = [
-                                './/span[contains(@class, "t-bold")]',
-                                './/span[contains(@class, "mr1")][contains(@class, "t-bold")]',
-                                './/div[contains(@class, "display-flex")]/span[1]'
-                            ]
-                            
-                            for title_selector in title_selectors:
-                                try:
-                                    title_elem = item.find_element(By.XPATH, title_selector)
-                                    if title_elem and title_elem.text.strip():
-                                        experience["title"] = title_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                            
-                            # Company - try multiple selectors
-                            company_selectors = [
-                                './/span[contains(@class, "t-14")][contains(@class, "t-normal")]',
-                                './/span[contains(@class, "t-14")][.//*[contains(@aria-hidden, "true")]]',
-                                './/div[contains(@class, "display-flex")]/span[2]'
-                            ]
-                            
-                            for company_selector in company_selectors:
-                                try:
-                                    company_elem = item.find_element(By.XPATH, company_selector)
-                                    if company_elem and company_elem.text.strip():
-                                        experience["company"] = company_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                            
-                            # Duration - try multiple selectors
-                            duration_selectors = [
-                                './/span[contains(@class, "t-14")][contains(@class, "t-normal")][contains(@class, "t-black--light")]',
-                                './/span[contains(text(), "Present")]/..',
-                                './/span[contains(text(), "yr")]/..'
-                            ]
-                            
-                            for duration_selector in duration_selectors:
-                                try:
-                                    duration_elem = item.find_element(By.XPATH, duration_selector)
-                                    if duration_elem and duration_elem.text.strip():
-                                        experience["duration"] = duration_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                        except Exception as inner_e:
-                            print(f"Error extracting structured experience data: {inner_e}")
+                    for row, experience in zip(found["items"], parsed):
+                        if experience is None:
+                            experience = {field: row[field] for field in ("title", "company", "duration") if row.get(field)}
                         
                         # Fallback to text parsing if structured extraction failed
                         if not experience.get("title") or not experience.get("company"):
-                            # Get all text from the item at once
-                            item_text = item.text.split('\n')
+                            item_text = row["lines"]
                             
                             # Extract title (usually first line)
                             if not experience.get("title") and len(item_text) > 0:
@@ -977,21 +2006,6 @@ class LinkedInScraper:
                         profile_data["experience"].append(experience)
                 else:
                     print("Experience section not found using any selector")
-                    
-                    # Fallback: Look for experience keywords in page source
-                    if "experience" in self.driver.page_source.lower():
-                        # Try to extract any job titles from the page
-                        common_titles = ["Engineer", "Developer", "Manager", "Director", "Analyst", "Designer"]
-                        page_text = self.driver.page_source.lower()
-                        
-                        for title in common_titles:
-                            if title.lower() in page_text:
-                                profile_data["experience"].append({
-                                    "title": title,
-                                    "company": "Unknown",
-                                    "duration": "Unknown"
-                                })
-                                break
             except Exception as e:
                 print(f"Error extracting experience: {e}")
             
@@ -1008,103 +2022,27 @@ class LinkedInScraper:
                 # Add a small random delay before extraction to appear more human-like
                 time.sleep(random.uniform(0.3, 0.9))
                 
-                # Try multiple selectors for education section with better error handling
-                education_selectors = [
-                    '//section[.//span[text()="Education"]]',
-                    '//section[contains(@class, "education")]',
-                    '//div[contains(@id, "education")]',
-                    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Education")]]'
-                ]
-                
-                education_section = None
-                for selector in education_selectors:
-                    try:
-                        # Use a slightly longer wait time for better reliability
-                        education_section = WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        if education_section:
-                            print(f"Found education section with selector: {selector}")
-                            break
-                    except (NoSuchElementException, TimeoutException):
-                        continue
+                education_section, selector = self._find_any(_EDUCATION_SECTION_XPATHS, 3)
+                if education_section:
+                    print(f"Found education section with selector: {selector}")
                 
                 if education_section:
-                    # Try multiple selectors for education items
-                    item_selectors = [
-                        './/ul/li',
-                        './/div[contains(@class, "pvs-entity")]',
-                        './/div[contains(@class, "display-flex")][.//*[contains(@class, "t-bold")]]'
-                    ]
-                    
-                    education_items = []
-                    for selector in item_selectors:
-                        items = education_section.find_elements(By.XPATH, selector)
-                        if items:
-                            print(f"Found {len(items)} education items with selector: {selector}")
-                            education_items = items[:3]  # Get up to 3 most recent education entries
-                            break
+                    # Read up to 3 of the most recent education entries in one script call
+                    found = _loads(self.driver.execute_script(
+                        self._SECTION_ITEMS_JS, education_section, self._by_hits(_SECTION_ITEM_XPATHS),
+                        {"school": _EDUCATION_SCHOOL_XPATHS, "degree": _EDUCATION_DEGREE_XPATHS, "dates": _EDUCATION_DATE_XPATHS}, 3
+                    ))
+                    if found["items"]:
+                        print(f"Found {found['total']} education items with selector: {found['selector']}")
+                        self._selector_hits[found["selector"]] += 1
                     
                     # Process education items with improved text extraction
-                    for item in education_items:
-                        education = {}
-                        
-                        # Try to extract structured data first
-                        try:
-                            # School - try multiple selectors
-                            school_selectors = [
-                                './/span[contains(@class, "t-bold")]',
-                                './/span[contains(@class, "mr1")][contains(@class, "t-bold")]',
-                                './/div[contains(@class, "display-flex")]/span[1]'
-                            ]
-                            
-                            for school_selector in school_selectors:
-                                try:
-                                    school_elem = item.find_element(By.XPATH, school_selector)
-                                    if school_elem and school_elem.text.strip():
-                                        education["school"] = school_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                            
-                            # Degree - try multiple selectors
-                            degree_selectors = [
-                                './/span[contains(@class, "t-14")][contains(@class, "t-normal")]',
-                                './/span[contains(@class, "t-14")][contains(text(), "Bachelor")]',
-                                './/span[contains(@class, "t-14")][contains(text(), "Master")]',
-                                './/div[contains(@class, "display-flex")]/span[2]'
-                            ]
-                            
-                            for degree_selector in degree_selectors:
-                                try:
-                                    degree_elem = item.find_element(By.XPATH, degree_selector)
-                                    if degree_elem and degree_elem.text.strip():
-                                        education["degree"] = degree_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                            
-                            # Dates - try multiple selectors
-                            date_selectors = [
-                                './/span[contains(@class, "t-14")][contains(@class, "t-normal")][contains(@class, "t-black--light")]',
-                                './/span[contains(text(), "20")]/..'  # Years typically contain 20xx
-                            ]
-                            
-                            for date_selector in date_selectors:
-                                try:
-                                    date_elem = item.find_element(By.XPATH, date_selector)
-                                    if date_elem and date_elem.text.strip():
-                                        education["dates"] = date_elem.text.strip()
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                        except Exception as inner_e:
-                            print(f"Error extracting structured education data: {inner_e}")
+                    for row in found["items"]:
+                        education = {field: row[field] for field in ("school", "degree", "dates") if row.get(field)}
                         
                         # Fallback to text parsing if structured extraction failed
                         if not education.get("school") or not education.get("degree"):
-                            # Get all text from the item at once
-                            item_text = item.text.split('\n')
+                            item_text = row["lines"]
                             
                             # Extract school (usually first line)
                             if not education.get("school") and len(item_text) > 0:
@@ -1129,13 +2067,14 @@ class LinkedInScraper:
                     print("Education section not found using any selector")
                     
                     # Fallback: Look for education keywords in page source
-                    if "education" in self.driver.page_source.lower():
+                    common_degrees = ["Bachelor", "Master", "MBA", "PhD", "BS", "MS", "BA", "Computer Science"]
+                    has_education, *degree_hits = self._page_contains(
+                        ["education"] + [degree.lower() for degree in common_degrees], ignore_case=True
+                    )
+                    if has_education:
                         # Try to extract any common degrees from the page
-                        common_degrees = ["Bachelor", "Master", "MBA", "PhD", "BS", "MS", "BA", "Computer Science"]
-                        page_text = self.driver.page_source.lower()
-                        
-                        for degree in common_degrees:
-                            if degree.lower() in page_text:
+                        for degree, present in zip(common_degrees, degree_hits):
+                            if present:
                                 profile_data["education"].append({
                                     "school": "Unknown University",
                                     "degree": degree
@@ -1162,45 +2101,21 @@ class LinkedInScraper:
                 try:
                     # Try to find skills heading to scroll to it
                     skills_heading = self.driver.find_element(By.XPATH, '//span[text()="Skills"]')
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", skills_heading)
-                    time.sleep(random.uniform(0.5, 1.0))  # Wait for any lazy-loaded content
+                    self._scroll_and_wait(
+                        "arguments[0].getBoundingClientRect().top + window.scrollY", skills_heading, timeout=1.0
+                    )  # Wait for any lazy-loaded content
                 except Exception:
                     # If we can't find the skills heading, just scroll down a bit more
-                    self.driver.execute_script("window.scrollBy(0, 500);")
-                    time.sleep(random.uniform(0.3, 0.8))
+                    self._scroll_and_wait("window.scrollY + 500", timeout=0.8)
                 
                 # Try multiple approaches to find skills
                 # Strategy 1: Look for the Skills section with multiple selector patterns
-                skills_section_selectors = [
-                    '//section[.//span[text()="Skills"]]',
-                    '//section[contains(@class, "skills")]',
-                    '//div[contains(@id, "skills")]',
-                    '//div[contains(@class, "pvs-list")][.//*[contains(text(), "Skills")]]'
-                ]
-                
-                skills_section = None
-                for selector in skills_section_selectors:
-                    try:
-                        skills_section = WebDriverWait(self.driver, 2).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        if skills_section:
-                            print(f"Found skills section with selector: {selector}")
-                            break
-                    except (NoSuchElementException, TimeoutException):
-                        continue
+                skills_section, selector = self._find_any(_SKILLS_SECTION_XPATHS, 2)
+                if skills_section:
+                    print(f"Found skills section with selector: {selector}")
                 
                 if skills_section:
-                    # Try multiple selectors for skill items within the skills section
-                    skill_selectors = [
-                        './/span[contains(@class, "t-bold")]',
-                        './/span[contains(@class, "display-block")]',
-                        './/div[contains(@class, "display-flex")]/span[1]',
-                        './/li//span[not(contains(text(), "Show"))]',
-                        './/span[contains(@class, "pvs-entity__path-node")]'
-                    ]
-                    
-                    for selector in skill_selectors:
+                    for selector in self._by_hits(_SKILL_ITEM_XPATHS):
                         try:
                             skill_items = skills_section.find_elements(By.XPATH, selector)
                             if skill_items:
@@ -1212,6 +2127,7 @@ class LinkedInScraper:
                                 
                                 # If we found skills, no need to try other selectors
                                 if profile_data["skills"]:
+                                    self._selector_hits[selector] += 1
                                     break
                         except Exception as inner_e:
                             print(f"Error with skill selector {selector}: {inner_e}")
@@ -1221,27 +2137,7 @@ class LinkedInScraper:
                 if not profile_data["skills"] or len(profile_data["skills"]) < 3:
                     try:
                         print("Looking for skill endorsements throughout the page...")
-                        # Look for skill tags throughout the profile with more comprehensive selectors
-                        skill_tag_selectors = [
-                            '//li[contains(@class, "skill")]//span',
-                            '//div[contains(@class, "endorsement")]//span',
-                            '//div[contains(@class, "pvs-entity__path-node")]//span',
-                            # Common programming languages and technologies
-                            '//div[contains(text(), "Python")]',
-                            '//div[contains(text(), "JavaScript")]',
-                            '//div[contains(text(), "Java")]',
-                            '//div[contains(text(), "C++")]',
-                            '//div[contains(text(), "SQL")]',
-                            '//div[contains(text(), "React")]',
-                            '//div[contains(text(), "Node.js")]',
-                            '//div[contains(text(), "Git")]',
-                            '//div[contains(text(), "Machine Learning")]',
-                            '//div[contains(text(), "Data Science")]',
-                            '//div[contains(text(), "AWS")]',
-                            '//div[contains(text(), "Cloud")]'
-                        ]
-                        
-                        for selector in skill_tag_selectors:
+                        for selector in _SKILL_TAG_XPATHS:
                             try:
                                 tags = self.driver.find_elements(By.XPATH, selector)
                                 for tag in tags:
@@ -1268,9 +2164,9 @@ class LinkedInScraper:
                         "UX/UI", "Design", "Figma", "Adobe", "Photoshop", "Illustrator", "InDesign"
                     ]
                     
-                    page_source = self.driver.page_source.lower()
-                    for skill in common_skills:
-                        if skill.lower() in page_source and skill not in profile_data["skills"]:
+                    skill_hits = self._page_contains([skill.lower() for skill in common_skills], ignore_case=True)
+                    for skill, present in zip(common_skills, skill_hits):
+                        if present and skill not in profile_data["skills"]:
                             profile_data["skills"].append(skill)
                             # Limit to 10 skills from page source to avoid false positives
                             if len(profile_data["skills"]) >= 10:
@@ -1289,6 +2185,7 @@ class LinkedInScraper:
                 }
                 
             print(f"Profile extraction completed in {elapsed_time:.1f} seconds")
+            self._store_result(cache_key, profile_data)
             return profile_data
             
         except Exception as e:
@@ -1304,12 +2201,183 @@ class LinkedInScraper:
         
     def close(self):
         """Close the browser and clean up"""
+        if self._cdp:
+            self._cdp.close()
+        self._cdp = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
         if self.driver:
             self.driver.quit()
             self.driver = None
+        self._authenticated = None
+        self._homepage_checked = False
+        if self._io_pool:
+            # Let pending screenshots finish writing
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+            
+    def scrape_profiles(self, profile_urls, timeout=20, debug=False):
+        """Scrape several profiles in turn using the same browser session
+        
+        Args:
+            profile_urls (iterable): LinkedIn profile URLs to scrape
+            timeout (int): Maximum time in seconds to spend on each profile
+            debug (bool): Whether to enable additional debug output and screenshots
+            
+        Yields:
+            dict: Extracted profile information, in the order of profile_urls
+        """
+        for index, profile_url in enumerate(profile_urls):
+            # The first profile sets up the session; the rest go straight to the profile
+            yield self.scrape_profile(profile_url, timeout=timeout, debug=debug, warm=index > 0)
+            
+    def __enter__(self):
+        """Use the scraper as a context manager so one browser serves several profiles"""
+        self.ensure_session()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the browser when leaving the context"""
+        self.close()
+        return False
+
+
+class LinkedInScraperPool:
+    """Several authenticated scrapers working through a list of profiles in parallel"""
+    
+    # More browsers than this on one account gets rate limited by LinkedIn
+    MAX_SIZE = 5
+    
+    def __init__(self, size=3, cookies_path=None, headless=True, min_interval=3.0, max_interval=6.0, persist_results=False):
+        """
+        Initialize the scraper pool
+        
+        Args:
+            size (int): Number of browsers to run, capped at MAX_SIZE
+            cookies_path (str or list): Cookies file shared by every browser, or
+                one path per browser
+            headless (bool): Whether to run the browsers in headless mode
+            min_interval (float): Minimum seconds between profile requests across the pool
+            max_interval (float): Maximum seconds between profile requests across the pool
+            persist_results (bool): Whether scraped profiles are also kept in cache.json
+        """
+        if isinstance(cookies_path, (list, tuple)) and len(cookies_path) != size:
+            raise ValueError(f"Expected {size} cookie paths, got {len(cookies_path)}")
+        if size > self.MAX_SIZE:
+            print(f"Limiting the pool to {self.MAX_SIZE} browsers to avoid LinkedIn rate limits")
+            size = self.MAX_SIZE
+        if isinstance(cookies_path, (list, tuple)):
+            self.cookies_paths = list(cookies_path)[:size]
+        else:
+            self.cookies_paths = [cookies_path] * size
+        self.size = size
+        self.headless = headless
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.persist_results = persist_results
+        self._scrapers = []
+        self._idle = queue.Queue()
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        
+    def start(self):
+        """Start and authenticate every browser before any profile is requested
+        
+        If any browser fails to start or authenticate, the ones already
+        started are closed again.
+        
+        Raises:
+            RuntimeError: If a cookie file is unusable or a browser couldn't be authenticated
+        """
+        # Check each cookie file once up front, so the refresh prompt is asked
+        # once for the whole pool rather than once per browser
+        for cookies_path in dict.fromkeys(self.cookies_paths):
+            try:
+                _check_cookie_age(cookies_path, os.stat(cookies_path))
+                cookie_file = _read_cookie_file(cookies_path)
+            except (TypeError, OSError) as e:
+                raise RuntimeError(f"Could not read cookies from {cookies_path}: {e}") from e
+            if cookie_file is None:
+                raise RuntimeError(f"Cookie file {cookies_path} is not usable")
+        
+        user_home = os.path.expanduser('~')
+        try:
+            for i, cookies_path in enumerate(self.cookies_paths):
+                # Chrome locks its profile directory, so each browser needs its own
+                scraper = LinkedInScraper(
+                    cookies_path=cookies_path,
+                    headless=self.headless,
+                    user_data_dir=os.path.join(user_home, f'.linkedin_chrome_profile_{i}'),
+                    persist_results=self.persist_results
+                )
+                scraper.prompt_refresh = False  # Already asked above
+                # Track it before starting so close() cleans it up on failure
+                self._scrapers.append(scraper)
+                if not scraper.ensure_session():
+                    raise RuntimeError(f"Browser {i + 1} could not authenticate with {cookies_path}")
+                self._idle.put(scraper)
+        except BaseException:
+            self.close()
+            raise
+            
+    def _wait_for_turn(self):
+        """Space requests across all threads to stay under LinkedIn's rate limits"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + random.uniform(self.min_interval, self.max_interval)
+        if start_at > now:
+            time.sleep(start_at - now)
+            
+    def _scrape(self, profile_url, timeout, debug):
+        """Scrape one profile on whichever browser is free"""
+        scraper = self._idle.get()
+        try:
+            self._wait_for_turn()
+            return scraper.scrape_profile(profile_url, timeout=timeout, debug=debug)
+        except Exception as e:
+            print(f"Error scraping {profile_url}: {e}")
+            return {"error": str(e)}
+        finally:
+            self._idle.put(scraper)
+            
+    def map(self, profile_urls, timeout=20, debug=False):
+        """Scrape profiles across the pool
+        
+        Args:
+            profile_urls (iterable): LinkedIn profile URLs to scrape
+            timeout (int): Maximum time in seconds to spend on each profile
+            debug (bool): Whether to enable additional debug output and screenshots
+            
+        Yields:
+            dict: Extracted profile information, in the order of profile_urls
+        """
+        if not self._scrapers:
+            self.start()
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            yield from executor.map(lambda url: self._scrape(url, timeout, debug), profile_urls)
+            
+    def close(self):
+        """Close every browser in the pool"""
+        for scraper in self._scrapers:
+            scraper.close()
+        self._scrapers = []
+        self._idle = queue.Queue()
+        
+    def __enter__(self):
+        """Start the browsers when entering the context"""
+        self.start()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the browsers when leaving the context"""
+        self.close()
+        return False
 
 
-def scrape_linkedin_profile(profile_url, cookies_path, headless=True, timeout=60, debug=False, browser_type='chrome'):
+def scrape_linkedin_profile(profile_url, cookies_path, headless=True, timeout=60, debug=False, browser_type='chrome',
+                            persist_results=False):
     """Convenience function to scrape a LinkedIn profile
     
     Args:
@@ -1319,6 +2387,8 @@ def scrape_linkedin_profile(profile_url, cookies_path, headless=True, timeout=60
         timeout (int): Maximum time in seconds to spend scraping a profile
         debug (bool): Whether to enable additional debug output and screenshots
         browser_type (str): Type of browser to use ('chrome' or 'firefox')
+        persist_results (bool): Whether scraped profiles are also kept in cache.json
+            next to the cookie file, so later runs can reuse them
         
     Returns:
         dict: Extracted profile information
@@ -1350,7 +2420,8 @@ def scrape_linkedin_profile(profile_url, cookies_path, headless=True, timeout=60
     start_time = time.time()
     
     # Create scraper with the specified browser type
-    scraper = LinkedInScraper(cookies_path=cookies_path, headless=headless, browser_type=browser_type)
+    scraper = LinkedInScraper(cookies_path=cookies_path, headless=headless, browser_type=browser_type,
+                              persist_results=persist_results)
     try:
         profile_data = scraper.scrape_profile(profile_url, timeout=timeout, debug=debug)
         elapsed_time = time.time() - start_time
@@ -1372,6 +2443,47 @@ def scrape_linkedin_profile(profile_url, cookies_path, headless=True, timeout=60
         scraper.close()
 
 
+def scrape_linkedin_profiles(profile_urls, cookies_path, headless=True, timeout=60, debug=False, max_concurrency=3,
+                             persist_results=False):
+    """Convenience function to scrape several LinkedIn profiles in parallel
+    
+    Every browser is authenticated once up front and then reused, so the
+    homepage visit and cookie loading are paid per browser rather than per profile.
+    
+    Args:
+        profile_urls (list): URLs of the LinkedIn profiles to scrape
+        cookies_path (str): Path to the cookies.json file for authentication
+        headless (bool): Whether to run the browsers in headless mode
+        timeout (int): Maximum time in seconds to spend scraping each profile
+        debug (bool): Whether to enable additional debug output and screenshots
+        max_concurrency (int): Number of browsers to run, at most LinkedInScraperPool.MAX_SIZE
+        persist_results (bool): Whether scraped profiles are also kept in cache.json
+            next to the cookie file, so later runs can reuse them
+        
+    Returns:
+        list: Extracted profile information, in the order of profile_urls
+    """
+    if not os.path.exists(cookies_path):
+        print(f"Error: Cookie file not found at {cookies_path}")
+        return [{"error": "Cookie file not found"} for _ in profile_urls]
+        
+    profile_urls = list(profile_urls)
+    size = max(1, min(max_concurrency, len(profile_urls)))
+    print(f"Scraping {len(profile_urls)} profiles with {size} browsers")
+    start_time = time.time()
+    
+    try:
+        with LinkedInScraperPool(size=size, cookies_path=cookies_path, headless=headless,
+                                 persist_results=persist_results) as pool:
+            results = list(pool.map(profile_urls, timeout=timeout, debug=debug))
+    except Exception as e:
+        print(f"Error starting browsers: {e}")
+        return [{"error": str(e)} for _ in profile_urls]
+        
+    print(f"Total scraping time: {time.time() - start_time:.1f} seconds")
+    return results
+
+
 if __name__ == "__main__":
     import argparse
     import sys
@@ -1385,6 +2497,7 @@ if __name__ == "__main__":
     parser.add_argument("--timeout", type=int, default=60, help="Timeout in seconds")
     parser.add_argument("--check-cookies", action="store_true", help="Only check if cookies are valid")
     parser.add_argument("--save-to-profiles", action="store_true", help="Save to data/linkedin_profiles folder")
+    parser.add_argument("--persist-results", action="store_true", help="Reuse profiles scraped in the last hour by earlier runs")
     
     args = parser.parse_args()
     
@@ -1412,7 +2525,8 @@ if __name__ == "__main__":
         args.cookies, 
         headless=not args.no_headless,
         timeout=args.timeout,
-        debug=args.debug
+        debug=args.debug,
+        persist_results=args.persist_results
     )
     
     # Extract username from profile URL for default filename
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""
+Async LinkedIn Profile Scraper
+
+This module extracts the same profile fields as scraper.py using Playwright's
+async API. Every profile opens in its own tab of one shared browser context,
+so several profiles load at once without a browser (and chromedriver) per
+profile.
+
+Install with: pip install playwright && playwright install chromium
+"""
+
+import os
+import time
+import json
+import random
+import asyncio
+
+# Playwright is optional; scraper.py covers the same profiles with Selenium
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+try:
+    from ._json_utils import loads as _loads
+except ImportError:
+    from _json_utils import loads as _loads
+
+from scraper import (
+    LinkedInScraper,
+    LinkedInScraperPool,
+    _read_cookie_file,
+    _CHROME_UA,
+    _CHALLENGE_URL_FRAGMENTS,
+    _NAME_XPATHS,
+    _HEADLINE_XPATHS,
+    _LOCATION_XPATHS,
+    _ABOUT_XPATHS,
+    _SECTION_ITEM_XPATHS,
+    _EXPERIENCE_SECTION_XPATHS,
+    _EXPERIENCE_TITLE_XPATHS,
+    _EXPERIENCE_COMPANY_XPATHS,
+    _EXPERIENCE_DURATION_XPATHS,
+    _EDUCATION_SECTION_XPATHS,
+    _EDUCATION_SCHOOL_XPATHS,
+    _EDUCATION_DEGREE_XPATHS,
+    _EDUCATION_DATE_XPATHS,
+    _SKILLS_SECTION_XPATHS,
+    _SKILL_ITEM_XPATHS,
+)
+
+# Returns the unique skill names under the skills section for the first
+# XPath that finds any, in the same arguments style as the Selenium scripts
+_SKILLS_JS = """
+    const [section, selectors] = arguments;
+    for (const selector of selectors) {
+        const found = document.evaluate(selector, section, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const skills = [];
+        for (let i = 0; i < found.snapshotLength; i++) {
+            const text = (found.snapshotItem(i).innerText || '').trim();
+            if (text.length > 1 && !skills.includes(text)) {
+                skills.push(text);
+            }
+        }
+        if (skills.length) {
+            return skills;
+        }
+    }
+    return [];
+"""
+
+
+def _js_value(value):
+    """Convert the selector tuples (and dicts of them) to lists for page.evaluate"""
+    if isinstance(value, (tuple, list)):
+        return [_js_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _js_value(item) for key, item in value.items()}
+    return value
+
+
+async def _evaluate(page, script, *args):
+    """Run a Selenium-style script (arguments[...] and return) in a Playwright page
+    
+    Args:
+        page: Playwright page
+        script (str): Script body written for driver.execute_script
+        *args: Script arguments; element handles arrive as DOM elements
+    
+    Returns:
+        The script's return value
+    """
+    return await page.evaluate(
+        f"(args) => (function () {{{script}}}).apply(null, args)", [_js_value(arg) for arg in args]
+    )
+
+
+async def _evaluate_async(page, script, *args):
+    """Run a Selenium-style async script, which reports back through its last argument
+    
+    Args:
+        page: Playwright page
+        script (str): Script body written for driver.execute_async_script
+        *args: Script arguments
+    
+    Returns:
+        The value passed to the script's callback
+    """
+    return await page.evaluate(
+        f"(args) => new Promise((resolve) => (function () {{{script}}}).apply(null, args.concat([resolve])))",
+        [_js_value(arg) for arg in args]
+    )
+
+
+async def _find_section(page, selectors):
+    """Return the first element matching any of the XPaths, or None"""
+    for selector in selectors:
+        section = await page.query_selector(f"xpath={selector}")
+        if section is not None:
+            return section
+    return None
+
+
+def _section_entries(found, fields, required):
+    """Turn the rows read by LinkedInScraper._SECTION_ITEMS_JS into profile entries
+    
+    Args:
+        found (dict): Parsed result of the section script
+        fields (tuple): Entry keys, in the order they appear as lines of an item
+        required (tuple): Keys set to "Not found" when they're still missing
+    
+    Returns:
+        list: Dicts keyed by fields
+    """
+    entries = []
+    for row in found["items"]:
+        entry = {field: row[field] for field in fields if row.get(field)}
+        
+        # Fall back to the item's text lines when the first two fields are missing
+        if not all(entry.get(field) for field in fields[:2]):
+            for field, line in zip(fields, row["lines"]):
+                if not entry.get(field):
+                    entry[field] = line.strip()
+        
+        for field in required:
+            if not entry.get(field):
+                entry[field] = "Not found"
+        entries.append(entry)
+    return entries
+
+
+async def extract_profile(page, profile_url, timeout=20):
+    """Open a profile in a tab and extract its information
+    
+    Args:
+        page: Playwright page in an authenticated context
+        profile_url (str): URL of the LinkedIn profile to scrape
+        timeout (int): Maximum time in seconds to wait for the profile to load
+    
+    Returns:
+        dict: Extracted profile information, in the same shape as
+            LinkedInScraper.scrape_profile
+    """
+    try:
+        await page.goto(profile_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+    except PlaywrightTimeoutError:
+        print(f"Profile page load timed out for {profile_url}, continuing anyway...")
+    
+    if any(fragment in page.url for fragment in _CHALLENGE_URL_FRAGMENTS):
+        return {"error": "Login required to view this profile"}
+    
+    try:
+        await page.wait_for_selector('h1', timeout=5000)
+    except PlaywrightTimeoutError:
+        pass  # The extraction below reports what it can find
+    
+    # Scroll through the page so lazy-loaded sections render
+    try:
+        await _evaluate_async(page, LinkedInScraper._SCROLL_JS)
+    except Exception as e:
+        print(f"Error during scrolling: {e}")
+    
+    basic_info = _loads(await _evaluate(
+        page, LinkedInScraper._BASIC_INFO_JS, _NAME_XPATHS, _HEADLINE_XPATHS, _LOCATION_XPATHS, _ABOUT_XPATHS
+    ))
+    profile_data = {
+        "basic_info": {field: basic_info.get(field) or "Not found" for field in ("name", "headline", "location")},
+        "about": basic_info.get("about", ""),
+        "experience": [],
+        "education": [],
+        "skills": [],
+        "interests": []
+    }
+    
+    experience_section = await _find_section(page, _EXPERIENCE_SECTION_XPATHS)
+    if experience_section is not None:
+        found = _loads(await _evaluate(
+            page, LinkedInScraper._SECTION_ITEMS_JS, experience_section, _SECTION_ITEM_XPATHS,
+            {"title": _EXPERIENCE_TITLE_XPATHS, "company": _EXPERIENCE_COMPANY_XPATHS, "duration": _EXPERIENCE_DURATION_XPATHS}, 3
+        ))
+        profile_data["experience"] = _section_entries(found, ("title", "company", "duration"), ("title", "company", "duration"))
+    
+    education_section = await _find_section(page, _EDUCATION_SECTION_XPATHS)
+    if education_section is not None:
+        found = _loads(await _evaluate(
+            page, LinkedInScraper._SECTION_ITEMS_JS, education_section, _SECTION_ITEM_XPATHS,
+            {"school": _EDUCATION_SCHOOL_XPATHS, "degree": _EDUCATION_DEGREE_XPATHS, "dates": _EDUCATION_DATE_XPATHS}, 3
+        ))
+        profile_data["education"] = _section_entries(found, ("school", "degree", "dates"), ("school", "degree"))
+    
+    skills_section = await _find_section(page, _SKILLS_SECTION_XPATHS)
+    if skills_section is not None:
+        profile_data["skills"] = await _evaluate(page, _SKILLS_JS, skills_section, _SKILL_ITEM_XPATHS)
+    
+    return profile_data
+
+
+async def scrape_profiles(profile_urls, cookies_path, headless=True, timeout=20, max_concurrency=5,
+                          min_interval=3.0, max_interval=6.0):
+    """Scrape several LinkedIn profiles concurrently in tabs of one browser
+    
+    Args:
+        profile_urls (list): URLs of the LinkedIn profiles to scrape
+        cookies_path (str): Path to the cookies.json file for authentication
+        headless (bool): Whether to run the browser in headless mode
+        timeout (int): Maximum time in seconds to wait for each profile to load
+        max_concurrency (int): Maximum number of profiles loading at once,
+            at most LinkedInScraperPool.MAX_SIZE
+        min_interval (float): Minimum seconds between profile requests
+        max_interval (float): Maximum seconds between profile requests
+    
+    Returns:
+        list: Extracted profile information, in the order of profile_urls
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        raise ImportError("playwright is required: pip install playwright && playwright install chromium")
+    
+    if not os.path.exists(cookies_path):
+        print(f"Error: Cookie file not found at {cookies_path}")
+        return [{"error": "Cookie file not found"} for _ in profile_urls]
+    
+    # Parse and validate the cookie file the same way the Selenium scraper does
+    cookie_file = _read_cookie_file(cookies_path)
+    if cookie_file is None:
+        return [{"error": "Invalid cookie file"} for _ in profile_urls]
+    data, _, cdp_cookies = cookie_file
+    user_agent = data.get('user_agent', _CHROME_UA) if isinstance(data, dict) else _CHROME_UA
+    
+    semaphore = asyncio.Semaphore(min(max_concurrency, LinkedInScraperPool.MAX_SIZE))
+    rate_lock = asyncio.Lock()
+    next_request_at = 0.0
+    
+    async def wait_for_turn():
+        # Space requests out to stay under LinkedIn's rate limits
+        nonlocal next_request_at
+        async with rate_lock:
+            now = time.monotonic()
+            start_at = max(now, next_request_at)
+            next_request_at = start_at + random.uniform(min_interval, max_interval)
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+    
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            # Every tab shares one context, so the cookies are loaded only once
+            context = await browser.new_context(user_agent=user_agent)
+            await context.add_cookies(cdp_cookies)
+            
+            async def scrape_one(profile_url):
+                async with semaphore:
+                    await wait_for_turn()
+                    page = await context.new_page()
+                    try:
+                        return await extract_profile(page, profile_url, timeout=timeout)
+                    except Exception as e:
+                        print(f"Error scraping {profile_url}: {e}")
+                        return {"error": str(e)}
+                    finally:
+                        await page.close()
+            
+            return await asyncio.gather(*(scrape_one(profile_url) for profile_url in profile_urls))
+        finally:
+            await browser.close()
+
+
+def sync_scrape_profiles(profile_urls, cookies_path, headless=True, timeout=20, max_concurrency=5):
+    """Synchronous wrapper for scrape_profiles
+    
+    Args:
+        profile_urls (list): URLs of the LinkedIn profiles to scrape
+        cookies_path (str): Path to the cookies.json file for authentication
+        headless (bool): Whether to run the browser in headless mode
+        timeout (int): Maximum time in seconds to wait for each profile to load
+        max_concurrency (int): Maximum number of profiles loading at once
+    
+    Returns:
+        list: Extracted profile information, in the order of profile_urls
+    """
+    return asyncio.run(scrape_profiles(
+        list(profile_urls), cookies_path, headless=headless, timeout=timeout, max_concurrency=max_concurrency
+    ))
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn profiles concurrently with Playwright")
+    parser.add_argument("profile_urls", nargs='+', help="LinkedIn profile URLs to scrape")
+    parser.add_argument("--cookies", default="cookies.json", help="Path to cookies.json file")
+    parser.add_argument("--output", help="Output file path (JSON)")
+    parser.add_argument("--no-headless", action="store_true", help="Run in visible browser mode")
+    parser.add_argument("--timeout", type=int, default=20, help="Timeout in seconds for each profile")
+    parser.add_argument("--concurrency", type=int, default=3, help="Number of profiles to load at once")
+    
+    args = parser.parse_args()
+    
+    start_time = time.time()
+    profiles = sync_scrape_profiles(
+        args.profile_urls,
+        args.cookies,
+        headless=not args.no_headless,
+        timeout=args.timeout,
+        max_concurrency=args.concurrency
+    )
+    print(f"Scraped {len(profiles)} profiles in {time.time() - start_time:.1f} seconds")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(profiles, f, indent=2)
+        print(f"Profile data saved to {args.output}")
+    else:
+        print(json.dumps(profiles, indent=2))
@@ -0,0 +1,76 @@
+"""
+Tests for the brace scanner the LinkedIn scripts use to find profile JSON
+
+Run with: python -m pytest scripts/test_json_scanner.py
+"""
+
+import os
+import sys
+import time
+
+# The LinkedIn scripts import each other as siblings, so use their directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scrapers", "linkedin"))
+
+from _json_utils import JsonObjectScanner, iter_json_objects
+
+PROFILE = '{"basic_info": {"name": "Ann"}, "experience": []}'
+
+def scan_in_chunks(text, chunk_size):
+    """Feed text to a scanner chunk_size characters at a time"""
+    scanner = JsonObjectScanner()
+    found = []
+    for i in range(0, len(text), chunk_size):
+        found.extend(scanner.feed(text[i:i + chunk_size]))
+    found.extend(scanner.finish())
+    return found
+
+def test_nested_objects():
+    """Only the outermost object is reported"""
+    text = 'log {"a": {"b": {"c": 1}}} more {"d": 2}'
+    assert list(iter_json_objects(text)) == ['{"a": {"b": {"c": 1}}}', '{"d": 2}']
+
+def test_braces_and_escaped_quotes_in_strings():
+    """Braces inside strings don't count, and escaped quotes don't end a string"""
+    text = 'x {"a": "}{", "b": "say \\"}\\" twice", "c": "\\\\"} y'
+    assert list(iter_json_objects(text)) == [text[2:-2]]
+
+def test_object_split_across_chunks():
+    """Objects are found wherever the chunk boundaries fall"""
+    text = 'prefix {"a": "\\"{"} middle ' + PROFILE + ' suffix'
+    expected = list(iter_json_objects(text))
+    assert expected == ['{"a": "\\"{"}', PROFILE]
+    for chunk_size in (1, 2, 3, 7, 64):
+        assert scan_in_chunks(text, chunk_size) == expected
+
+def test_stray_brace_before_profile():
+    """An unclosed brace earlier in the output doesn't hide a later profile"""
+    text = 'Step 1: { stray brace\n' + PROFILE + '\n'
+    assert list(iter_json_objects(text)) == [PROFILE]
+    assert scan_in_chunks(text, 5) == [PROFILE]
+
+def test_bytes_input():
+    """Bytes-like input is scanned the same way and yields bytes"""
+    text = b'{ stray ' + PROFILE.encode() + b' {"x": "}"}'
+    assert list(iter_json_objects(text)) == [PROFILE.encode(), b'{"x": "}"}']
+
+def test_max_object_size():
+    """An object left open past max_object_size is given up on"""
+    scanner = JsonObjectScanner(max_object_size=100)
+    found = list(scanner.feed('{ stray ' + PROFILE))
+    found.extend(scanner.feed('x' * 200))
+    assert found == [PROFILE]
+    assert scanner._chunks == []
+
+def test_unclosed_braces_scan_in_linear_time():
+    """Many unclosed braces don't make the scan rescan the text"""
+    text = '{"a": 1 ' * 32768 + PROFILE
+    start = time.perf_counter()
+    assert list(iter_json_objects(text)) == [PROFILE]
+    assert scan_in_chunks(text, 4096) == [PROFILE]
+    assert time.perf_counter() - start < 2
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name} passed")